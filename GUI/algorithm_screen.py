@@ -1,34 +1,139 @@
+import queue
+import threading
+import time
+
 import customtkinter as ctk
 from tkinter import messagebox, ttk
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
 
 from utils import historial
 
-from models.process import Process
-# Algoritmos sin bloqueos
-from algoritmos.fifo import fifo
-from algoritmos.sjf import sjf
-from algoritmos.srtf import srtf
-from algoritmos.roundrobin import round_robin
-# Algoritmos con bloqueos
-from algoritmos.fifo_blocking import fifo_blocking
-from algoritmos.sjf_blocking import sjf_blocking
-from algoritmos.srtf_blocking import srtf_blocking
-from algoritmos.round_robin_blocking import round_robin_blocking
-# Algoritmos de prioridades
-from algoritmos.priority import priority
-from algoritmos.priority_blocking import priority_blocking
-
-from utils.metricas import calcular_metricas
-from utils.excel_export import exportar_a_excel
-
-
-class AlgorithmScreen(ctk.CTkFrame):
+from models.gantt import Gantt
+from models.workload import Workload
+from algoritmos.comparacion import comparar
+from algoritmos.barrido import barrer_quantum
+from algoritmos.motor import Seguimiento, SimulacionCancelada
+from algoritmos.reproduccion import grabar
+
+from utils.cache import simular_cacheado
+
+# Reproducción paso a paso: milisegundos entre cuadros y cuadros para recorrer toda la corrida
+PAUSA_REPRODUCCION_MS = 150
+CUADROS_REPRODUCCION = 200
+# PIDs que se listan por cola en el estado de la reproducción
+MAX_PIDS_ESTADO = 12
+
+
+class _SimulacionEnHilo:
+    """
+    Simulaciones en un hilo aparte, con barra de progreso y botón Cancelar.
+
+    La usan la pantalla de algoritmos y las ventanas de comparación y de barrido.
+    Quien la usa arma los widgets con _crear_progreso() y define _raiz() (el widget
+    Tk de la ventana), _ubicar_progreso() (dónde mostrar la barra) y
+    _habilitar(activo) (sus botones, apagados mientras corre una simulación).
+    """
+    # Qué cuentan los avisos de un lote (ver _en_hilo con por_tareas=True)
+    TAREAS = "tareas"
+
+    def _crear_progreso(self, padre):
+        """Barra, etiqueta y Cancelar en un frame que se muestra sólo mientras corre."""
+        self.seguimiento = None
+        self.progreso = None          # último (fracción, texto) informado
+        self.cola_resultado = queue.Queue()
+        self.frame_progreso = ctk.CTkFrame(padre)
+        self.progress_bar = ctk.CTkProgressBar(self.frame_progreso, width=300)
+        self.progress_bar.pack(side="left", padx=5)
+        self.label_progreso = ctk.CTkLabel(self.frame_progreso, text="", font=("Arial", 12))
+        self.label_progreso.pack(side="left", padx=5)
+        self.btn_cancelar = ctk.CTkButton(self.frame_progreso, text="Cancelar", command=self._cancelar_simulacion,
+                                          fg_color="red", hover_color="#aa0000", width=80)
+        self.btn_cancelar.pack(side="left", padx=5)
+
+    def _en_hilo(self, tarea, al_terminar, error="Ocurrió un error al ejecutar", por_tareas=False):
+        """
+        Corre tarea() en un hilo con progreso y cancelación: la ventana sigue respondiendo.
+        El hilo sólo deja datos (progreso y resultado); Tk se actualiza desde _sondear,
+        que llama a al_terminar(resultado) si la tarea terminó bien.
+        por_tareas: la barra cuenta tareas terminadas de un lote (comparación, barrido)
+        en lugar del avance de cada corrida del motor.
+        """
+        if por_tareas:
+            self.seguimiento = Seguimiento(al_tarea=self._recibir_tarea)
+        else:
+            self.seguimiento = Seguimiento(al_progresar=self._recibir_progreso)
+        self.progreso = None
+        hilo = threading.Thread(target=self._correr_en_hilo, args=(self.seguimiento, tarea), daemon=True)
+        self._mostrar_progreso()
+        hilo.start()
+        self._raiz().after(50, self._sondear, al_terminar, error)
+
+    def _correr_en_hilo(self, seguimiento, tarea):
+        """Cuerpo del hilo de simulación: deja en cola_resultado ("ok"|"cancelado"|"error", dato)."""
+        try:
+            with seguimiento:
+                resultado = tarea()
+            self.cola_resultado.put(("ok", resultado))
+        except SimulacionCancelada:
+            self.cola_resultado.put(("cancelado", None))
+        except Exception as e:
+            self.cola_resultado.put(("error", e))
+
+    # Llamados desde el hilo de simulación: sólo guardan el dato, no tocan Tk
+    def _recibir_progreso(self, tiempo, completados, total):
+        self.progreso = (completados / total if total else 0,
+                         f"t = {tiempo}  |  {completados}/{total} procesos")
+
+    def _recibir_tarea(self, hechas, total):
+        self.progreso = (hechas / total if total else 0, f"{hechas}/{total} {self.TAREAS}")
+
+    def _sondear(self, al_terminar, error):
+        """Actualiza la barra de progreso y, al terminar el hilo, muestra el resultado."""
+        raiz = self._raiz()
+        if not raiz.winfo_exists():
+            return
+        try:
+            estado, dato = self.cola_resultado.get_nowait()
+        except queue.Empty:
+            if self.progreso is not None:
+                fraccion, texto = self.progreso
+                self.progress_bar.set(fraccion)
+                self.label_progreso.configure(text=texto)
+            raiz.after(100, self._sondear, al_terminar, error)
+            return
+
+        self.seguimiento = None
+        self._ocultar_progreso()
+        if estado == "error":
+            messagebox.showerror("Error", f"{error}: {dato}", parent=raiz)
+        elif estado == "ok":
+            al_terminar(dato)
+
+    def _mostrar_progreso(self):
+        self.progress_bar.set(0)
+        self.label_progreso.configure(text="Simulando...")
+        self.btn_cancelar.configure(state="normal")
+        self._ubicar_progreso()
+        self._habilitar(False)
+
+    def _ocultar_progreso(self):
+        self.frame_progreso.pack_forget()
+        self._habilitar(True)
+
+    def _cancelar_simulacion(self):
+        """Pide cortar la simulación en curso (el motor se detiene en el próximo aviso)."""
+        if self.seguimiento is not None:
+            self.seguimiento.cancelar()
+            self.btn_cancelar.configure(state="disabled")
+            self.label_progreso.configure(text="Cancelando...")
+
+
+class AlgorithmScreen(_SimulacionEnHilo, ctk.CTkFrame):
     def __init__(self, master, procesos_data, volver_inicio):
         super().__init__(master)
         self.procesos_data = procesos_data
         self.volver_inicio = volver_inicio
+        # Carga inmutable compartida por todas las corridas de esta pantalla
+        self.carga = Workload.desde_dicts(procesos_data)
         
         # Variables para almacenar el gráfico actual
         self.current_gantt = None
@@ -45,12 +150,19 @@ class AlgorithmScreen(ctk.CTkFrame):
         self.original_ylim = None
         self.current_ax = None
         self.current_canvas = None
+        self.current_vista = None
         
         # Variables para el pan (arrastrar)
         self.pan_start_x = None
         self.pan_start_y = None
         self.is_panning = False
 
+        # Reproducción paso a paso (la grabación se hace al pedirla, ver _asegurar_grabacion)
+        self.current_nombre = None
+        self.grabacion = None
+        self.tiempo_reproduccion = 0
+        self.reproduciendo = False
+
         # --- Detectar uso de prioridades ---
         self.usar_prioridades = self._detectar_uso_prioridades()
 
@@ -86,6 +198,9 @@ class AlgorithmScreen(ctk.CTkFrame):
         btn_frame.pack(pady=10)
         self.btn_run = ctk.CTkButton(btn_frame, text="Ejecutar", command=self._run_algorithm)
         self.btn_run.pack(side="left", padx=5)
+        self.btn_compare = ctk.CTkButton(btn_frame, text="Comparar", command=self._comparar_algoritmos,
+                                       fg_color="teal", hover_color="#006666")
+        self.btn_compare.pack(side="left", padx=5)
         self.btn_export = ctk.CTkButton(btn_frame, text="Exportar PNG", command=self._export_png, 
                                       fg_color="green", hover_color="#006600")
         self.btn_export.pack(side="left", padx=5)
@@ -139,6 +254,33 @@ class AlgorithmScreen(ctk.CTkFrame):
         self.label_quantum.pack(side="left", padx=5)
         self.entry_quantum = ctk.CTkEntry(self.frame_quantum, placeholder_text="Ej: 2", width=60)
         self.entry_quantum.pack(side="left", padx=5)
+        self.btn_barrido = ctk.CTkButton(self.frame_quantum, text="Barrido de quantum",
+                                         command=self._barrido_quantum, width=140)
+        self.btn_barrido.pack(side="left", padx=5)
+
+        # --- Progreso de la simulación (sólo mientras corre) ---
+        # Simulación en curso en un hilo aparte (ver _run_algorithm y _SimulacionEnHilo)
+        self._crear_progreso(self)
+
+        # --- Reproducción paso a paso (después de ejecutar) ---
+        self.frame_reproduccion = ctk.CTkFrame(self)
+        controles = ctk.CTkFrame(self.frame_reproduccion, fg_color="transparent")
+        controles.pack()
+        ctk.CTkLabel(controles, text="Reproducción:", font=("Arial", 12, "bold")).pack(side="left", padx=5)
+        self.btn_paso_atras = ctk.CTkButton(controles, text="⏮", width=30, command=self._paso_atras)
+        self.btn_paso_atras.pack(side="left", padx=2)
+        self.btn_play = ctk.CTkButton(controles, text="▶", width=30, command=self._alternar_reproduccion)
+        self.btn_play.pack(side="left", padx=2)
+        self.btn_paso_adelante = ctk.CTkButton(controles, text="⏭", width=30, command=self._paso_adelante)
+        self.btn_paso_adelante.pack(side="left", padx=2)
+        self.slider_tiempo = ctk.CTkSlider(controles, from_=0, to=1, width=300, command=self._mover_slider)
+        self.slider_tiempo.set(0)
+        self.slider_tiempo.pack(side="left", padx=5)
+        self.label_tiempo = ctk.CTkLabel(controles, text="t = -", font=("Arial", 12))
+        self.label_tiempo.pack(side="left", padx=5)
+        self.label_estado_reproduccion = ctk.CTkLabel(self.frame_reproduccion, text="", font=("Arial", 12),
+                                                      justify="left")
+        self.label_estado_reproduccion.pack(padx=5)
 
         # --- Tabla BCP ---
         if self.usar_prioridades:
@@ -155,6 +297,8 @@ class AlgorithmScreen(ctk.CTkFrame):
         # --- Label promedios ---
         self.label_promedios = ctk.CTkLabel(self, text="TRM: -    |    TEM: -", font=("Arial", 14))
         self.label_promedios.pack(pady=5)
+        self.label_extendidas = ctk.CTkLabel(self, text="", font=("Arial", 12), text_color="gray")
+        self.label_extendidas.pack(pady=(0, 5))
 
         # --- Frame gráfico ---
         self.frame_gantt = ctk.CTkFrame(self)
@@ -173,52 +317,73 @@ class AlgorithmScreen(ctk.CTkFrame):
         else:
             self.frame_quantum.pack_forget()
 
+    def _nombre_algoritmo(self, algo):
+        """Nombre en algoritmos/registro.py que corresponde a la opción 'algo' del menú."""
+        tiene_bloqueos = self.carga.tiene_bloqueos()
+        if algo == "FIFO":
+            return "fifo_blocking"
+        if algo == "SJF":
+            return "sjf_blocking"
+        if algo == "SRTF":
+            return "srtf_blocking"
+        if algo == "Round Robin":
+            # Detectar si los procesos tienen bloqueos
+            return "round_robin_blocking" if tiene_bloqueos else "round_robin"
+        if algo == "Prioridades":
+            return "priority_blocking" if tiene_bloqueos else "priority"
+        if algo == "Prioridades con Bloqueos":
+            return "priority_blocking"
+        raise ValueError(f"Algoritmo no soportado: {algo}")
+
     def _run_algorithm(self):
-        # Crear copias de los procesos para no modificar los originales
-        from copy import deepcopy
-        procesos = [Process(p["pid"], p["arrival_time"], p["bursts"], p.get("priority", 0)) for p in self.procesos_data]
+        if self.seguimiento is not None:
+            return  # ya hay una simulación en curso
         algo = self.selected_algo.get()
+        quantum = None
+        if algo == "Round Robin":
+            quantum = self._get_quantum()
+            if quantum is None:
+                return
 
         try:
-            if algo == "FIFO":
-                gantt, result = fifo_blocking(procesos)
-            elif algo == "SJF":
-                gantt, result = sjf_blocking(procesos)
-            elif algo == "SRTF":
-                gantt, result = srtf_blocking(procesos)
-            elif algo == "Round Robin":
-                quantum = self._get_quantum()
-                if quantum is None:
-                    return
-                # Detectar si los procesos tienen bloqueos
-                tiene_bloqueos = any(len(p["bursts"]) > 1 for p in self.procesos_data)
-                if tiene_bloqueos:
-                    gantt, result = round_robin_blocking(procesos, quantum)
-                else:
-                    gantt, result = round_robin(procesos, quantum)
-            elif algo == "Prioridades":
-                # Detectar si los procesos tienen bloqueos
-                tiene_bloqueos = any(len(p["bursts"]) > 1 for p in self.procesos_data)
-                if tiene_bloqueos:
-                    gantt, result = priority_blocking(procesos)
-                else:
-                    gantt, result = priority(procesos)
-            elif algo == "Prioridades con Bloqueos":
-                gantt, result = priority_blocking(procesos)
-        except Exception as e:
+            nombre = self._nombre_algoritmo(algo)
+        except ValueError as e:
             messagebox.showerror("Error", f"Ocurrió un error al ejecutar: {e}")
             return
 
-        # Calcular métricas
-        metricas, trm, tem = calcular_metricas(result)
+        self._detener_reproduccion()
+        # Reabrir un ejercicio ya simulado (misma carga, algoritmo y quantum) usa la caché
+        self._en_hilo(lambda: simular_cacheado(nombre, self.carga, quantum, extendidas=True),
+                      lambda resultado: self._mostrar_resultados(algo, nombre, quantum, *resultado))
 
+    # ---------- Simulación en hilo (ver _SimulacionEnHilo) ----------
+    def _raiz(self):
+        return self
+
+    def _ubicar_progreso(self):
+        self.frame_progreso.pack(before=self.tree, pady=5)
+
+    def _habilitar(self, activo):
+        estado = "normal" if activo else "disabled"
+        self.btn_run.configure(state=estado)
+        self.btn_play.configure(state=estado)
+
+    def destroy(self):
+        # Al salir de la pantalla no queda un hilo simulando en segundo plano
+        if self.seguimiento is not None:
+            self.seguimiento.cancelar()
+        super().destroy()
+
+    def _mostrar_resultados(self, algo, nombre, quantum, gantt, metricas, trm, tem, extendidas):
         # Actualizar tabla
         for row in self.tree.get_children():
             self.tree.delete(row)
+        # Prioridad original por pid (un dict, no una búsqueda por fila)
+        prioridades = {p["pid"]: p.get("priority", 0) for p in reversed(self.procesos_data)}
+        # Recorrer la tabla arma las filas (dicts) recién acá
         for m in metricas:
             if self.usar_prioridades:
-                # Obtener la prioridad del proceso original
-                priority = next((p.get("priority", 0) for p in self.procesos_data if p["pid"] == m["PID"]), 0)
+                priority = prioridades.get(m["PID"], 0)
                 self.tree.insert("", "end", values=(m["PID"], m["Llegada"], priority, m["CPU"], m["TR"], m["TE"]))
             else:
                 # Sin columna de prioridad
@@ -228,6 +393,15 @@ class AlgorithmScreen(ctk.CTkFrame):
         self.label_promedios.configure(
             text=f"TRM (Tiempo de Respuesta Medio): {trm:.2f}    |    TEM (Tiempo de Espera Medio): {tem:.2f}"
         )
+        # Métricas extendidas (utils/metricas.metricas_extendidas)
+        e = extendidas
+        self.label_extendidas.configure(
+            text=f"Throughput: {e['throughput']:.3f} proc/u    |    CPU: {e['utilizacion_cpu']:.0%}    |    "
+                 f"E/S: {e['utilizacion_es']:.0%}    |    Cambios de contexto: {e['cambios_contexto']}    |    "
+                 f"TPRM (primera respuesta): {e['TPRM']:.2f}\n"
+                 f"TR p50/p95/p99: {e['TR_p50']}/{e['TR_p95']}/{e['TR_p99']}    |    "
+                 f"TE p50/p95/p99: {e['TE_p50']}/{e['TE_p95']}/{e['TE_p99']}"
+        )
 
         # Almacenar datos del gráfico para exportación
         self.current_gantt = gantt
@@ -235,16 +409,105 @@ class AlgorithmScreen(ctk.CTkFrame):
         self.current_metricas = metricas
         self.current_trm = trm
         self.current_tem = tem
-        
-        # Obtener quantum si es Round Robin
-        if algo == "Round Robin":
-            self.current_quantum = self._get_quantum()
-        else:
-            self.current_quantum = None
+        # Quantum con el que se simuló (None si no es Round Robin)
+        self.current_quantum = quantum
+        self.current_nombre = nombre
         
         # Mostrar gráfico
         self._mostrar_gantt_embebido(gantt, algo)
 
+        # La reproducción del resultado anterior ya no vale: se graba al pedirla
+        self.grabacion = None
+        self.tiempo_reproduccion = 0
+        self.slider_tiempo.set(0)
+        self.label_tiempo.configure(text="t = -")
+        self.label_estado_reproduccion.configure(text="▶ para reproducir la corrida paso a paso")
+        self.frame_reproduccion.pack(before=self.tree, pady=5)
+
+    # ---------- Reproducción paso a paso ----------
+    def _asegurar_grabacion(self, continuar):
+        """Llama a continuar() con la corrida grabada; la primera vez la graba en el hilo de simulación."""
+        if self.grabacion is not None:
+            continuar()
+            return
+        if self.seguimiento is not None or self.current_nombre is None:
+            return
+        nombre, quantum = self.current_nombre, self.current_quantum
+
+        def al_grabar(resultado):
+            _, _, self.grabacion = resultado
+            duracion = self.grabacion.duracion()
+            self.slider_tiempo.configure(from_=0, to=max(duracion, 1))
+            continuar()
+
+        self._en_hilo(lambda: grabar(nombre, self.carga, quantum), al_grabar)
+
+    def _ir_a(self, t):
+        """Muestra el estado en t: línea en el Gantt y colas debajo (sin rearmar la figura)."""
+        self.tiempo_reproduccion = t
+        estado = self.grabacion.estado_en(t)
+        self.slider_tiempo.set(t)
+        self.label_tiempo.configure(text=f"t = {t}")
+        bloqueados = [f"{pid} (hasta {hasta})" for pid, hasta in estado["bloqueados"]]
+        self.label_estado_reproduccion.configure(text=(
+            f"CPU: {estado['ejecutando'] or 'libre'}    |    "
+            f"Listos: {_resumir(estado['listos'])}    |    "
+            f"Bloqueados: {_resumir(bloqueados)}    |    "
+            f"Terminados: {estado['terminados']}/{len(self.grabacion.pids)}"
+        ))
+        if self.current_vista is not None:
+            self.current_vista.marcar_tiempo(t)
+
+    def _alternar_reproduccion(self):
+        if self.reproduciendo:
+            self._detener_reproduccion()
+            return
+
+        def iniciar():
+            if self.tiempo_reproduccion >= self.grabacion.duracion():
+                self.tiempo_reproduccion = 0
+            self.reproduciendo = True
+            self.btn_play.configure(text="⏸")
+            self._ir_a(self.tiempo_reproduccion)
+            self.after(PAUSA_REPRODUCCION_MS, self._cuadro_reproduccion)
+
+        self._asegurar_grabacion(iniciar)
+
+    def _cuadro_reproduccion(self):
+        if not self.reproduciendo or not self.winfo_exists():
+            return
+        duracion = self.grabacion.duracion()
+        if isinstance(duracion, int):
+            paso = max(1, duracion // CUADROS_REPRODUCCION)
+        else:
+            paso = duracion / CUADROS_REPRODUCCION
+        self._ir_a(min(self.tiempo_reproduccion + paso, duracion))
+        if self.tiempo_reproduccion >= duracion:
+            self._detener_reproduccion()
+        else:
+            self.after(PAUSA_REPRODUCCION_MS, self._cuadro_reproduccion)
+
+    def _detener_reproduccion(self):
+        self.reproduciendo = False
+        self.btn_play.configure(text="▶")
+
+    def _paso_adelante(self):
+        """Salta al próximo instante con eventos."""
+        self._detener_reproduccion()
+        self._asegurar_grabacion(lambda: self._ir_a(self.grabacion.instante_siguiente(self.tiempo_reproduccion)))
+
+    def _paso_atras(self):
+        """Vuelve al instante con eventos anterior."""
+        self._detener_reproduccion()
+        self._asegurar_grabacion(lambda: self._ir_a(self.grabacion.instante_anterior(self.tiempo_reproduccion)))
+
+    def _mover_slider(self, valor):
+        if self.grabacion is None:
+            self.slider_tiempo.set(0)
+            return
+        self._detener_reproduccion()
+        self._ir_a(round(valor) if isinstance(self.grabacion.duracion(), int) else valor)
+
     def _get_quantum(self):
         try:
             quantum = int(self.entry_quantum.get())
@@ -256,94 +519,31 @@ class AlgorithmScreen(ctk.CTkFrame):
             return None
 
     def _mostrar_gantt_embebido(self, gantt_chart, algo):
+        # matplotlib se importa con el primer gráfico, no al abrir la aplicación
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from utils.gantt import dibujar_gantt, tamano_figura
+
         for widget in self.frame_gantt.winfo_children():
             widget.destroy()
 
-        norm = []
-        for seg in gantt_chart:
-            if len(seg) == 3:
-                pid, start, end = seg
-                tipo = "CPU" if pid != "IDLE" else "IDLE"
-                norm.append((pid, start, end, tipo))
-            elif len(seg) == 4:
-                norm.append(seg)
+        gantt = Gantt.de(gantt_chart)
 
         # Ajustar el tamaño del gráfico según el número de procesos y duración total
-        num_procesos = len(set(pid for pid, _, _, tipo in norm if pid != "IDLE"))
-        max_time = max(end for _, _, end, _ in norm) if norm else 1
-        
-        # Calcular dimensiones adaptativas - más ancho para mostrar todos los ticks
-        fig_width = max(15, max_time * 0.25)  # Ancho basado en duración total, más generoso
-        fig_height = max(4, num_procesos * 0.8)  # Altura basada en número de procesos
-        
-        fig, ax = plt.subplots(figsize=(fig_width, fig_height))
-        
-        procesos_unicos = [pid for pid, _, _, tipo in norm if pid != "IDLE"]
-        procesos_unicos = list(dict.fromkeys(procesos_unicos))
-        y_positions = {pid: i for i, pid in enumerate(procesos_unicos)}
-
-        colors = {}
-        color_palette = plt.cm.get_cmap("tab20", len(procesos_unicos) + 1)
-
-        for pid, start, end, tipo in norm:
-            if tipo == "IDLE":
-                color = "lightgray"
-                hatch = None
-                y = -1
-                alpha = 0.7
-            elif tipo == "BLOCK":
-                color = "darkred"
-                hatch = "///"
-                y = y_positions.get(pid, 0)
-                alpha = 0.8
-            else:  # CPU
-                if pid not in colors:
-                    colors[pid] = color_palette(len(colors))
-                color = colors[pid]
-                hatch = None
-                y = y_positions.get(pid, 0)
-                alpha = 1.0
-
-            ax.barh(y, end - start, left=start, height=0.6, color=color, 
-                   edgecolor='black', hatch=hatch, alpha=alpha)
-            
-            if tipo != "IDLE":
-                # Mostrar el PID y el tipo de ráfaga
-                text = f"{pid}\n({tipo})" if tipo == "BLOCK" else str(pid)
-                ax.text((start + end) / 2, y, text, ha='center', va='center',
-                        fontsize=7, color="white" if tipo == "BLOCK" else "black",
-                        weight="bold" if tipo == "BLOCK" else "normal")
-
-        if procesos_unicos:
-            ax.set_yticks(list(y_positions.values()))
-            ax.set_yticklabels(list(y_positions.keys()))
-        else:
-            ax.set_yticks([])
-
-        if norm:
-            max_time = max(end for _, _, end, _ in norm)
-            
-            # Mostrar TODOS los ticks del 0 al tiempo máximo
-            ax.set_xticks(range(0, max_time + 1))
-            ax.set_xlim(0, max_time)
-        ax.set_xlabel("Tiempo")
-        ax.set_ylabel("Procesos")
-        ax.set_title(f"Diagrama de Gantt - {algo}")
-        ax.grid(True, axis='x', linestyle='--', alpha=0.6)
-        
-        # Agregar leyenda explicativa
-        legend_elements = [
-            plt.Rectangle((0,0),1,1, facecolor='lightblue', edgecolor='black', label='CPU'),
-            plt.Rectangle((0,0),1,1, facecolor='darkred', edgecolor='black', hatch='///', label='Bloqueo (E/S)'),
-            plt.Rectangle((0,0),1,1, facecolor='lightgray', edgecolor='black', alpha=0.7, label='IDLE')
-        ]
-        ax.legend(handles=legend_elements, loc='upper left', bbox_to_anchor=(1.02, 1))
+        num_procesos = gantt.num_procesos()
+        max_time = gantt.duracion() if len(gantt) else 1
+        
+        # Dimensiones adaptativas con tope (el resto se recorre con zoom y arrastre)
+        fig, ax = plt.subplots(figsize=tamano_figura(max_time, num_procesos))
+        # La vista dibuja sólo lo visible y se rearma con zoom y arrastre
+        vista = dibujar_gantt(ax, gantt, f"Diagrama de Gantt - {algo}")
 
         # Ajustar el layout para mejor uso del espacio
         plt.tight_layout()
         
         # Crear canvas directamente en el frame
         canvas = FigureCanvasTkAgg(fig, master=self.frame_gantt)
+        vista.conectar(canvas)
         canvas.draw()
         canvas.get_tk_widget().pack(fill="both", expand=True)
         
@@ -351,6 +551,7 @@ class AlgorithmScreen(ctk.CTkFrame):
         self.current_fig = fig
         self.current_ax = ax
         self.current_canvas = canvas
+        self.current_vista = vista
         
         # Guardar los límites originales para el zoom
         self.original_xlim = ax.get_xlim()
@@ -414,6 +615,7 @@ class AlgorithmScreen(ctk.CTkFrame):
             from tkinter import filedialog
             import os
             from datetime import datetime
+            from utils.excel_export import exportar_a_excel
             
             # Generar nombre de archivo con timestamp
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -428,21 +630,18 @@ class AlgorithmScreen(ctk.CTkFrame):
             )
             
             if file_path:
-                # Crear archivo temporal
-                temp_file = exportar_a_excel(
+                # Escribir directamente en la ubicación seleccionada
+                exportar_a_excel(
                     procesos_data=self.procesos_data,
                     algoritmo=self.current_algorithm,
                     gantt_data=self.current_gantt,
                     metricas=self.current_metricas,
                     trm=self.current_trm,
                     tem=self.current_tem,
-                    quantum=self.current_quantum
+                    quantum=self.current_quantum,
+                    ruta=file_path
                 )
                 
-                # Mover el archivo a la ubicación seleccionada
-                import shutil
-                shutil.move(temp_file, file_path)
-                
                 messagebox.showinfo("Éxito", f"Resultados exportados exitosamente a:\n{file_path}")
                 
         except Exception as e:
@@ -477,7 +676,7 @@ class AlgorithmScreen(ctk.CTkFrame):
         self.zoom_level = 1.0
         self.current_ax.set_xlim(self.original_xlim)
         self.current_ax.set_ylim(self.original_ylim)
-        self.current_canvas.draw()
+        self.current_canvas.draw_idle()
         self._update_zoom_label()
         
         # Resetear variables de pan
@@ -502,7 +701,7 @@ class AlgorithmScreen(ctk.CTkFrame):
         
         self.current_ax.set_xlim(new_xlim)
         self.current_ax.set_ylim(new_ylim)
-        self.current_canvas.draw()
+        self.current_canvas.draw_idle()
 
     def _update_zoom_label(self):
         """Actualiza la etiqueta que muestra el nivel de zoom actual."""
@@ -533,6 +732,8 @@ class AlgorithmScreen(ctk.CTkFrame):
             self.is_panning = True
             self.pan_start_x = event.xdata
             self.pan_start_y = event.ydata
+            # Durante el arrastre sólo se redibujan los tramos (blitting)
+            self.current_vista.iniciar_arrastre()
             # Cambiar el cursor para indicar que se puede arrastrar
             self.current_canvas.get_tk_widget().configure(cursor="fleur")
 
@@ -541,8 +742,10 @@ class AlgorithmScreen(ctk.CTkFrame):
         if self.current_ax is None:
             return
         
-        if event.button == 1:  # Botón izquierdo del mouse
+        if event.button == 1 and self.is_panning:  # Botón izquierdo del mouse
             self.is_panning = False
+            # Dibujo completo (ticks y grilla) en la posición final
+            self.current_vista.terminar_arrastre()
             self.pan_start_x = None
             self.pan_start_y = None
             # Restaurar el cursor normal
@@ -570,12 +773,20 @@ class AlgorithmScreen(ctk.CTkFrame):
         # Actualizar los límites
         self.current_ax.set_xlim(new_xlim)
         self.current_ax.set_ylim(new_ylim)
-        self.current_canvas.draw()
+        self.current_vista.arrastrar()
         
         # Actualizar la posición de inicio para el siguiente movimiento
         self.pan_start_x = event.xdata
         self.pan_start_y = event.ydata
 
+    def _comparar_algoritmos(self):
+        """Abre la ventana de comparación de algoritmos sobre este ejercicio."""
+        ComparacionWindow(self)
+
+    def _barrido_quantum(self):
+        """Abre la ventana de barrido de quantum (Round Robin) sobre este ejercicio."""
+        BarridoQuantumWindow(self)
+
     def _open_in_window(self):
         """Abre el gráfico actual en una ventana separada."""
         if self.current_gantt is None or self.current_algorithm is None:
@@ -586,6 +797,16 @@ class AlgorithmScreen(ctk.CTkFrame):
         GanttWindow(self.current_gantt, self.current_algorithm)
 
 
+def _resumir(elementos):
+    """Texto con los primeros MAX_PIDS_ESTADO elementos y cuántos quedan."""
+    if not elementos:
+        return "-"
+    texto = ", ".join(str(e) for e in elementos[:MAX_PIDS_ESTADO])
+    if len(elementos) > MAX_PIDS_ESTADO:
+        texto += f" … (+{len(elementos) - MAX_PIDS_ESTADO})"
+    return texto
+
+
 class GanttWindow:
     """Ventana separada para mostrar el diagrama de Gantt con zoom y pan."""
     
@@ -605,6 +826,7 @@ class GanttWindow:
         self.original_ylim = None
         self.current_ax = None
         self.current_canvas = None
+        self.current_vista = None
         self.pan_start_x = None
         self.pan_start_y = None
         self.is_panning = False
@@ -656,92 +878,22 @@ class GanttWindow:
         """Crea el diagrama de Gantt en la ventana."""
         import matplotlib.pyplot as plt
         from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from utils.gantt import dibujar_gantt, tamano_figura
         
-        # Normalizar datos del gantt
-        norm = []
-        for seg in self.gantt_chart:
-            if len(seg) == 3:
-                pid, start, end = seg
-                tipo = "CPU" if pid != "IDLE" else "IDLE"
-                norm.append((pid, start, end, tipo))
-            elif len(seg) == 4:
-                norm.append(seg)
+        gantt = Gantt.de(self.gantt_chart)
 
         # Calcular dimensiones
-        num_procesos = len(set(pid for pid, _, _, tipo in norm if pid != "IDLE"))
-        max_time = max(end for _, _, end, _ in norm) if norm else 1
-        
-        fig_width = max(15, max_time * 0.25)
-        fig_height = max(6, num_procesos * 0.8)
-        
-        fig, ax = plt.subplots(figsize=(fig_width, fig_height))
-        
-        # Procesar datos
-        procesos_unicos = [pid for pid, _, _, tipo in norm if pid != "IDLE"]
-        procesos_unicos = list(dict.fromkeys(procesos_unicos))
-        y_positions = {pid: i for i, pid in enumerate(procesos_unicos)}
-
-        colors = {}
-        color_palette = plt.cm.get_cmap("tab20", len(procesos_unicos) + 1)
-
-        # Dibujar barras
-        for pid, start, end, tipo in norm:
-            if tipo == "IDLE":
-                color = "lightgray"
-                hatch = None
-                y = -1
-                alpha = 0.7
-            elif tipo == "BLOCK":
-                color = "darkred"
-                hatch = "///"
-                y = y_positions.get(pid, 0)
-                alpha = 0.8
-            else:  # CPU
-                if pid not in colors:
-                    colors[pid] = color_palette(len(colors))
-                color = colors[pid]
-                hatch = None
-                y = y_positions.get(pid, 0)
-                alpha = 1.0
-
-            ax.barh(y, end - start, left=start, height=0.6, color=color, 
-                   edgecolor='black', hatch=hatch, alpha=alpha)
-            
-            if tipo != "IDLE":
-                text = f"{pid}\n({tipo})" if tipo == "BLOCK" else str(pid)
-                ax.text((start + end) / 2, y, text, ha='center', va='center',
-                        fontsize=7, color="white" if tipo == "BLOCK" else "black",
-                        weight="bold" if tipo == "BLOCK" else "normal")
-
-        # Configurar ejes
-        if procesos_unicos:
-            ax.set_yticks(list(y_positions.values()))
-            ax.set_yticklabels(list(y_positions.keys()))
-        else:
-            ax.set_yticks([])
-
-        if norm:
-            max_time = max(end for _, _, end, _ in norm)
-            ax.set_xticks(range(0, max_time + 1))
-            ax.set_xlim(0, max_time)
-            
-        ax.set_xlabel("Tiempo")
-        ax.set_ylabel("Procesos")
-        ax.set_title(f"Diagrama de Gantt - {self.algorithm}")
-        ax.grid(True, axis='x', linestyle='--', alpha=0.6)
-        
-        # Leyenda
-        legend_elements = [
-            plt.Rectangle((0,0),1,1, facecolor='lightblue', edgecolor='black', label='CPU'),
-            plt.Rectangle((0,0),1,1, facecolor='darkred', edgecolor='black', hatch='///', label='Bloqueo (E/S)'),
-            plt.Rectangle((0,0),1,1, facecolor='lightgray', edgecolor='black', alpha=0.7, label='IDLE')
-        ]
-        ax.legend(handles=legend_elements, loc='upper left', bbox_to_anchor=(1.02, 1))
+        num_procesos = gantt.num_procesos()
+        max_time = gantt.duracion() if len(gantt) else 1
+        
+        fig, ax = plt.subplots(figsize=tamano_figura(max_time, num_procesos, alto_minimo=6))
+        vista = dibujar_gantt(ax, gantt, f"Diagrama de Gantt - {self.algorithm}")
 
         plt.tight_layout()
         
         # Crear canvas
         canvas = FigureCanvasTkAgg(fig, master=self.graph_frame)
+        vista.conectar(canvas)
         canvas.draw()
         canvas.get_tk_widget().pack(fill="both", expand=True)
         
@@ -749,6 +901,7 @@ class GanttWindow:
         self.current_fig = fig
         self.current_ax = ax
         self.current_canvas = canvas
+        self.current_vista = vista
         self.original_xlim = ax.get_xlim()
         self.original_ylim = ax.get_ylim()
         
@@ -781,7 +934,7 @@ class GanttWindow:
         self.zoom_level = 1.0
         self.current_ax.set_xlim(self.original_xlim)
         self.current_ax.set_ylim(self.original_ylim)
-        self.current_canvas.draw()
+        self.current_canvas.draw_idle()
         self._update_zoom_label()
         self.is_panning = False
         self.pan_start_x = None
@@ -799,7 +952,7 @@ class GanttWindow:
         new_ylim = (y_center - y_range/2, y_center + y_range/2)
         self.current_ax.set_xlim(new_xlim)
         self.current_ax.set_ylim(new_ylim)
-        self.current_canvas.draw()
+        self.current_canvas.draw_idle()
 
     def _update_zoom_label(self):
         """Actualiza la etiqueta que muestra el nivel de zoom actual."""
@@ -822,14 +975,16 @@ class GanttWindow:
             self.is_panning = True
             self.pan_start_x = event.xdata
             self.pan_start_y = event.ydata
+            self.current_vista.iniciar_arrastre()
             self.current_canvas.get_tk_widget().configure(cursor="fleur")
 
     def _on_mouse_release(self, event):
         """Maneja el evento de soltar el botón del mouse para terminar pan."""
         if self.current_ax is None:
             return
-        if event.button == 1:
+        if event.button == 1 and self.is_panning:
             self.is_panning = False
+            self.current_vista.terminar_arrastre()
             self.pan_start_x = None
             self.pan_start_y = None
             self.current_canvas.get_tk_widget().configure(cursor="")
@@ -848,6 +1003,248 @@ class GanttWindow:
         new_ylim = (ylim[0] - dy, ylim[1] - dy)
         self.current_ax.set_xlim(new_xlim)
         self.current_ax.set_ylim(new_ylim)
-        self.current_canvas.draw()
+        self.current_vista.arrastrar()
         self.pan_start_x = event.xdata
-        self.pan_start_y = event.ydata
\ No newline at end of file
+        self.pan_start_y = event.ydata
+
+
+class ComparacionWindow(_SimulacionEnHilo):
+    """Ventana para comparar varios algoritmos sobre el mismo ejercicio (en paralelo)."""
+    TAREAS = "algoritmos"
+
+    def __init__(self, screen):
+        self.screen = screen
+
+        # Crear ventana
+        self.window = ctk.CTkToplevel()
+        self.window.title("Comparar algoritmos")
+        self.window.geometry("720x420")
+        self.window.resizable(True, True)
+
+        self._create_interface()
+
+        self.window.transient()
+        self.window.grab_set()
+        self.window.protocol("WM_DELETE_WINDOW", self._cerrar)
+
+    def _create_interface(self):
+        """Crea la selección de algoritmos, el quantum y la tabla de resultados."""
+        ctk.CTkLabel(self.window, text="Algoritmos a comparar", font=("Arial", 16, "bold")).pack(pady=(10, 5))
+
+        checks_frame = ctk.CTkFrame(self.window)
+        checks_frame.pack(fill="x", padx=10, pady=5)
+        self.checks = {}
+        for algo in self.screen.algoritmos:
+            var = ctk.BooleanVar(value=True)
+            ctk.CTkCheckBox(checks_frame, text=algo, variable=var).pack(side="left", padx=5, pady=5)
+            self.checks[algo] = var
+
+        control_frame = ctk.CTkFrame(self.window)
+        control_frame.pack(fill="x", padx=10, pady=5)
+        ctk.CTkLabel(control_frame, text="Quantum (Round Robin):").pack(side="left", padx=5)
+        self.entry_quantum = ctk.CTkEntry(control_frame, placeholder_text="Ej: 2", width=60)
+        self.entry_quantum.pack(side="left", padx=5)
+        quantum_actual = self.screen.entry_quantum.get().strip()
+        if quantum_actual:
+            self.entry_quantum.insert(0, quantum_actual)
+        self.btn_comparar = ctk.CTkButton(control_frame, text="Comparar", command=self._comparar,
+                                          fg_color="teal", hover_color="#006666")
+        self.btn_comparar.pack(side="left", padx=10)
+
+        # La comparación corre en un hilo (ver _SimulacionEnHilo)
+        self._crear_progreso(self.window)
+
+        columns = ("Algoritmo", "TRM", "TEM", "Finalización")
+        self.tree = ttk.Treeview(self.window, columns=columns, show="headings", height=8)
+        for col in columns:
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=150, anchor="center")
+        self.tree.pack(fill="both", expand=True, padx=10, pady=10)
+
+        self.label_estado = ctk.CTkLabel(self.window, text="", font=("Arial", 12), text_color="gray")
+        self.label_estado.pack(pady=(0, 10))
+
+    def _comparar(self):
+        if self.seguimiento is not None:
+            return  # ya hay una comparación en curso
+        seleccion = [algo for algo, var in self.checks.items() if var.get()]
+        if not seleccion:
+            messagebox.showwarning("Advertencia", "Seleccione al menos un algoritmo.", parent=self.window)
+            return
+
+        quantum = None
+        if "Round Robin" in seleccion:
+            try:
+                quantum = int(self.entry_quantum.get())
+                if quantum <= 0:
+                    raise ValueError
+            except ValueError:
+                messagebox.showerror("Error", "Ingrese un quantum válido (> 0)", parent=self.window)
+                return
+
+        nombres = {algo: self.screen._nombre_algoritmo(algo) for algo in seleccion}
+        carga = self.screen.carga
+        inicio = time.perf_counter()
+        self._en_hilo(lambda: comparar(carga, list(nombres.values()), quantum),
+                      lambda resultados: self._mostrar_resultados(seleccion, nombres, resultados, inicio),
+                      error="Ocurrió un error al comparar", por_tareas=True)
+
+    def _mostrar_resultados(self, seleccion, nombres, resultados, inicio):
+        duracion = time.perf_counter() - inicio
+        por_nombre = {r["algoritmo"]: r for r in resultados}
+        for row in self.tree.get_children():
+            self.tree.delete(row)
+        for algo in seleccion:
+            r = por_nombre[nombres[algo]]
+            fin = max(r["metricas"].columna("Finalización"), default=0)
+            self.tree.insert("", "end", values=(algo, f"{r['trm']:.2f}", f"{r['tem']:.2f}", fin))
+
+        self.label_estado.configure(text=f"{len(seleccion)} algoritmos comparados en {duracion:.2f} s")
+
+    # ---------- Simulación en hilo (ver _SimulacionEnHilo) ----------
+    def _raiz(self):
+        return self.window
+
+    def _ubicar_progreso(self):
+        self.frame_progreso.pack(before=self.tree, padx=10, pady=5)
+
+    def _habilitar(self, activo):
+        self.btn_comparar.configure(state="normal" if activo else "disabled")
+
+    def _cerrar(self):
+        # Cerrar la ventana corta la comparación en curso
+        if self.seguimiento is not None:
+            self.seguimiento.cancelar()
+        self.window.destroy()
+
+
+class BarridoQuantumWindow(_SimulacionEnHilo):
+    """Ventana para simular Round Robin con un rango de quantums y ver TRM, TEM y cambios de contexto."""
+
+    def __init__(self, screen):
+        self.screen = screen
+
+        # Crear ventana
+        self.window = ctk.CTkToplevel()
+        self.window.title("Barrido de quantum - Round Robin")
+        self.window.geometry("1000x600")
+        self.window.resizable(True, True)
+
+        self._create_interface()
+
+        self.window.transient()
+        self.window.grab_set()
+        self.window.protocol("WM_DELETE_WINDOW", self._cerrar)
+
+    def _create_interface(self):
+        """Crea el rango de quantums, la tabla de resultados y el área del gráfico."""
+        control_frame = ctk.CTkFrame(self.window)
+        control_frame.pack(fill="x", padx=10, pady=5)
+        ctk.CTkLabel(control_frame, text="Quantum desde:").pack(side="left", padx=5)
+        self.entry_desde = ctk.CTkEntry(control_frame, width=60)
+        self.entry_desde.insert(0, "1")
+        self.entry_desde.pack(side="left", padx=5)
+        ctk.CTkLabel(control_frame, text="hasta:").pack(side="left", padx=5)
+        self.entry_hasta = ctk.CTkEntry(control_frame, width=60)
+        self.entry_hasta.insert(0, "20")
+        self.entry_hasta.pack(side="left", padx=5)
+        self.btn_simular = ctk.CTkButton(control_frame, text="Simular", command=self._simular,
+                                         fg_color="teal", hover_color="#006666")
+        self.btn_simular.pack(side="left", padx=10)
+        self.label_estado = ctk.CTkLabel(control_frame, text="", font=("Arial", 12), text_color="gray")
+        self.label_estado.pack(side="left", padx=10)
+
+        # El barrido corre en un hilo (ver _SimulacionEnHilo)
+        self._crear_progreso(self.window)
+
+        self.body = body = ctk.CTkFrame(self.window)
+        body.pack(fill="both", expand=True, padx=10, pady=5)
+
+        columns = ("Quantum", "TRM", "TEM", "Cambios de contexto")
+        self.tree = ttk.Treeview(body, columns=columns, show="headings")
+        for col in columns:
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=90, anchor="center")
+        scroll = ttk.Scrollbar(body, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scroll.set)
+        self.tree.pack(side="left", fill="y")
+        scroll.pack(side="left", fill="y")
+
+        self.graph_frame = ctk.CTkFrame(body)
+        self.graph_frame.pack(side="left", fill="both", expand=True, padx=(10, 0))
+
+    def _simular(self):
+        if self.seguimiento is not None:
+            return  # ya hay un barrido en curso
+        try:
+            desde = int(self.entry_desde.get())
+            hasta = int(self.entry_hasta.get())
+            if desde <= 0 or hasta < desde:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "Ingrese un rango válido (0 < desde <= hasta)", parent=self.window)
+            return
+
+        algoritmo = self.screen._nombre_algoritmo("Round Robin")
+        carga = self.screen.carga
+        inicio = time.perf_counter()
+        self._en_hilo(lambda: barrer_quantum(carga, range(desde, hasta + 1), algoritmo),
+                      lambda filas: self._mostrar_resultados(filas, inicio),
+                      error="Ocurrió un error en el barrido", por_tareas=True)
+
+    def _mostrar_resultados(self, filas, inicio):
+        duracion = time.perf_counter() - inicio
+        for row in self.tree.get_children():
+            self.tree.delete(row)
+        for f in filas:
+            self.tree.insert("", "end", values=(f["quantum"], f"{f['trm']:.2f}", f"{f['tem']:.2f}",
+                                                f["cambios_contexto"]))
+        self.label_estado.configure(text=f"{len(filas)} quantums simulados en {duracion:.2f} s")
+        self._graficar(filas)
+
+    # ---------- Simulación en hilo (ver _SimulacionEnHilo) ----------
+    def _raiz(self):
+        return self.window
+
+    def _ubicar_progreso(self):
+        self.frame_progreso.pack(before=self.body, padx=10, pady=5)
+
+    def _habilitar(self, activo):
+        self.btn_simular.configure(state="normal" if activo else "disabled")
+
+    def _cerrar(self):
+        # Cerrar la ventana corta el barrido en curso
+        if self.seguimiento is not None:
+            self.seguimiento.cancelar()
+        self.window.destroy()
+
+    def _graficar(self, filas):
+        """Curvas de TRM y TEM (eje izquierdo) y cambios de contexto (eje derecho) según el quantum."""
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        for widget in self.graph_frame.winfo_children():
+            widget.destroy()
+
+        quantums = [f["quantum"] for f in filas]
+        fig, ax = plt.subplots(figsize=(7, 4.5))
+        ax.plot(quantums, [f["trm"] for f in filas], marker="o", markersize=3, label="TRM")
+        ax.plot(quantums, [f["tem"] for f in filas], marker="o", markersize=3, label="TEM")
+        ax.set_xlabel("Quantum")
+        ax.set_ylabel("Tiempo")
+        ax.grid(True, alpha=0.3)
+
+        ax_cc = ax.twinx()
+        ax_cc.plot(quantums, [f["cambios_contexto"] for f in filas], color="gray",
+                   linestyle="--", label="Cambios de contexto")
+        ax_cc.set_ylabel("Cambios de contexto")
+
+        lineas, etiquetas = ax.get_legend_handles_labels()
+        lineas_cc, etiquetas_cc = ax_cc.get_legend_handles_labels()
+        ax.legend(lineas + lineas_cc, etiquetas + etiquetas_cc, loc="upper right")
+        fig.tight_layout()
+
+        canvas = FigureCanvasTkAgg(fig, master=self.graph_frame)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill="both", expand=True)
+        plt.close(fig)
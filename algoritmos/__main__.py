@@ -0,0 +1,233 @@
+# algoritmos/__main__.py
+"""
+Ejecución por línea de comandos (sin GUI ni gráficos):
+
+    python -m algoritmos ENTRADA [ENTRADA ...] -a ALGORITMO[,ALGORITMO...] [-q QUANTUM]
+                         [--config N[,N...]] [--formato texto|jsonl] [--salida DIR]
+
+ENTRADA puede ser:
+  - un JSON con el formato de input_historial.json (lista de configuraciones o una sola
+    configuración {"nombre", "procesos": [...]}); cada configuración es un escenario
+  - un CSV con encabezado pid,arrival_time,bursts[,priority] (también se aceptan
+    nombre/arrival/llegada, rafagas y prioridad); las ráfagas van entre comillas con
+    el formato de la GUI: "3,(2),5"
+
+Por cada escenario y algoritmo se emite el Gantt y las métricas por stdout (texto o
+una línea JSON por corrida), o bien dos CSV por corrida en --salida.
+"""
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+
+from models.gantt import Gantt
+from models.workload import Workload
+from utils.metricas import (calcular_metricas, imprimir_metricas_extendidas, imprimir_tabla_metricas,
+                            metricas_extendidas)
+from utils.parsers import config_a_procesos_data, parse_bursts
+
+from . import registro
+
+# Alias aceptados en los encabezados del CSV
+_COLUMNAS_CSV = {
+    "pid": ("pid", "nombre"),
+    "arrival_time": ("arrival_time", "arrival", "llegada"),
+    "bursts": ("bursts", "rafagas", "ráfagas"),
+    "priority": ("priority", "prioridad"),
+}
+
+
+# ---------- Lectura de escenarios ----------
+def leer_escenarios(ruta, indices=None):
+    """
+    Devuelve [(nombre_escenario, procesos_data), ...] leídos de un JSON o CSV.
+    indices: posiciones de configuración a usar (sólo JSON con varias configuraciones).
+    """
+    if ruta.lower().endswith(".csv"):
+        nombre = os.path.splitext(os.path.basename(ruta))[0]
+        return [(nombre, _leer_csv(ruta))]
+
+    with open(ruta, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    configs = data if isinstance(data, list) else [data]
+
+    escenarios = []
+    for i, config in enumerate(configs):
+        if indices is not None and i not in indices:
+            continue
+        nombre = config.get("nombre") or f"Config {i + 1}"
+        escenarios.append((nombre, _procesos_data_de(config)))
+    return escenarios
+
+
+def _procesos_data_de(config):
+    """Acepta configuraciones del historial ({nombre, arrival}) o ejercicios ({pid, arrival_time})."""
+    procesos = config.get("procesos", [])
+    if procesos and "pid" in procesos[0]:
+        return [{
+            "pid": p["pid"],
+            "arrival_time": int(p.get("arrival_time", 0)),
+            "priority": int(p.get("priority", 0)),
+            "bursts": list(p.get("bursts", [])),
+        } for p in procesos]
+    return config_a_procesos_data(config)
+
+
+def _leer_csv(ruta):
+    with open(ruta, "r", encoding="utf-8", newline="") as f:
+        lector = csv.DictReader(f)
+        encabezado = {c.strip().lower(): c for c in (lector.fieldnames or [])}
+        columnas = {}
+        for campo, alias in _COLUMNAS_CSV.items():
+            columnas[campo] = next((encabezado[a] for a in alias if a in encabezado), None)
+        faltantes = [c for c in ("pid", "arrival_time", "bursts") if columnas[c] is None]
+        if faltantes:
+            raise ValueError(f"{ruta}: faltan columnas {', '.join(faltantes)}")
+
+        procesos_data = []
+        for fila, registro_csv in enumerate(lector, 2):
+            try:
+                prioridad = registro_csv.get(columnas["priority"]) if columnas["priority"] else ""
+                procesos_data.append({
+                    "pid": registro_csv[columnas["pid"]].strip(),
+                    "arrival_time": int(registro_csv[columnas["arrival_time"]]),
+                    "priority": int(prioridad) if prioridad and prioridad.strip() else 0,
+                    "bursts": parse_bursts(registro_csv[columnas["bursts"]]),
+                })
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"{ruta}, fila {fila}: {e}") from None
+    return procesos_data
+
+
+# ---------- Salida ----------
+def _gantt_normalizado(gantt):
+    """Tuplas (pid, inicio, fin, tipo) aunque el algoritmo devuelva (pid, inicio, fin)."""
+    return Gantt.de(gantt).tramos()
+
+
+def _emitir_texto(escenario, algoritmo, quantum, gantt, metricas, trm, tem, extendidas):
+    titulo = f"=== {escenario} | {algoritmo}" + (f" (quantum={quantum})" if quantum else "") + " ==="
+    print(titulo)
+    print(f"{'PID':<8}{'Inicio':<10}{'Fin':<10}{'Tipo':<6}")
+    for pid, inicio, fin, tipo in _gantt_normalizado(gantt):
+        print(f"{pid:<8}{inicio:<10}{fin:<10}{tipo:<6}")
+    print()
+    imprimir_tabla_metricas(metricas, trm, tem)
+    imprimir_metricas_extendidas(extendidas)
+    print()
+
+
+def _emitir_jsonl(escenario, algoritmo, quantum, gantt, metricas, trm, tem, extendidas):
+    fila = {
+        "escenario": escenario,
+        "algoritmo": algoritmo,
+        "quantum": quantum,
+        "gantt": [list(t) for t in _gantt_normalizado(gantt)],
+        "metricas": list(metricas),
+        "trm": trm,
+        "tem": tem,
+        "extendidas": extendidas,
+    }
+    print(json.dumps(fila, ensure_ascii=False))
+
+
+def _escribir_csv(directorio, escenario, algoritmo, gantt, metricas):
+    """Escribe <escenario>__<algoritmo>_gantt.csv y _metricas.csv; devuelve la base usada."""
+    base = re.sub(r"[^\w.-]+", "_", f"{escenario}__{algoritmo}")
+    with open(os.path.join(directorio, base + "_gantt.csv"), "w", encoding="utf-8", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(["PID", "Inicio", "Fin", "Tipo"])
+        w.writerows(_gantt_normalizado(gantt))
+    with open(os.path.join(directorio, base + "_metricas.csv"), "w", encoding="utf-8", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=["PID", "Llegada", "CPU", "Finalización", "TR", "TE"])
+        w.writeheader()
+        w.writerows(metricas)
+    return base
+
+
+# ---------- Programa ----------
+def _argumentos(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m algoritmos",
+        description="Simula algoritmos de planificación de CPU sin interfaz gráfica.",
+    )
+    parser.add_argument("entradas", nargs="+", metavar="ENTRADA",
+                        help="archivo JSON (formato input_historial.json) o CSV")
+    parser.add_argument("-a", "--algoritmo", required=True,
+                        help=f"uno o varios separados por coma, o 'todos' ({', '.join(registro.nombres())})")
+    parser.add_argument("-q", "--quantum", type=int, default=None,
+                        help="quantum para Round Robin")
+    parser.add_argument("--config", default=None,
+                        help="índices (desde 0) de las configuraciones del JSON a simular, separados por coma")
+    parser.add_argument("--formato", choices=("texto", "jsonl"), default="texto",
+                        help="formato de salida por stdout (por defecto: texto)")
+    parser.add_argument("--salida", default=None, metavar="DIR",
+                        help="escribir Gantt y métricas como CSV en DIR (por stdout sólo un resumen)")
+    args = parser.parse_args(argv)
+
+    if args.algoritmo.strip().lower() == "todos":
+        args.algoritmos = registro.nombres()
+    else:
+        args.algoritmos = [a.strip() for a in args.algoritmo.split(",") if a.strip()]
+    for nombre in args.algoritmos:
+        if nombre not in registro.ALGORITMOS:
+            parser.error(f"algoritmo desconocido: '{nombre}' (opciones: {', '.join(registro.nombres())})")
+        if registro.requiere_quantum(nombre) and (args.quantum is None or args.quantum <= 0):
+            parser.error(f"'{nombre}' requiere --quantum > 0")
+
+    try:
+        args.indices = None if args.config is None else {int(i) for i in args.config.split(",")}
+    except ValueError:
+        parser.error("--config debe ser una lista de enteros separados por coma")
+    return args
+
+
+def main(argv=None):
+    args = _argumentos(argv)
+    if args.salida:
+        os.makedirs(args.salida, exist_ok=True)
+    emitir = _emitir_jsonl if args.formato == "jsonl" else _emitir_texto
+
+    errores = 0
+    for ruta in args.entradas:
+        try:
+            escenarios = leer_escenarios(ruta, args.indices)
+        except (OSError, ValueError) as e:
+            print(f"Error al leer {ruta}: {e}", file=sys.stderr)
+            errores += 1
+            continue
+
+        for escenario, procesos_data in escenarios:
+            # Una carga inmutable por escenario, compartida por todos los algoritmos
+            carga = Workload.desde_dicts(procesos_data)
+            for algoritmo in args.algoritmos:
+                quantum = args.quantum if registro.requiere_quantum(algoritmo) else None
+                try:
+                    gantt, procesos = registro.ejecutar(algoritmo, carga, quantum)
+                    metricas, trm, tem = calcular_metricas(procesos)
+                    # Las métricas extendidas sólo se emiten por stdout (no van a los CSV)
+                    extendidas = None if args.salida else metricas_extendidas(gantt, procesos)
+                except Exception as e:
+                    print(f"Error en {escenario} / {algoritmo}: {e}", file=sys.stderr)
+                    errores += 1
+                    continue
+
+                if args.salida:
+                    base = _escribir_csv(args.salida, escenario, algoritmo, gantt, metricas)
+                    print(f"{base}\tTRM={trm:.2f}\tTEM={tem:.2f}")
+                else:
+                    emitir(escenario, algoritmo, quantum, gantt, metricas, trm, tem, extendidas)
+                sys.stdout.flush()
+
+    return 1 if errores else 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except BrokenPipeError:
+        # stdout cerrado antes de tiempo (por ejemplo, '| head'): terminar sin traza
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
@@ -0,0 +1,118 @@
+# algoritmos/barrido.py
+"""
+Barrido de quantum para Round Robin.
+
+Simula un rango de quantums sobre la misma carga y devuelve, por quantum, TRM, TEM y
+cantidad de cambios de contexto. Los quantums se reparten en bloques entre procesos
+trabajadores (la carga se envía una sola vez a cada uno) y cada tarea devuelve sólo
+los números de la curva, no los procesos. Con un Seguimiento activo se informa cada
+bloque (o quantum, sin trabajadores) terminado y se puede cancelar (ver
+comparacion.mapear_en_pool).
+
+Además, desde cierto quantum ningún tramo agota su quantum y el plan ya no cambia
+(ver quantum_saturacion): los quantums mayores reutilizan esa única simulación.
+"""
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from models.workload import Workload
+from utils.metricas import calcular_metricas, contar_cambios_contexto
+
+from . import registro
+from .comparacion import UMBRAL_PARALELO, mapear_en_pool
+from .motor import avisar_tarea
+
+# Carga recibida por cada proceso trabajador (ver _iniciar_trabajador)
+_carga_trabajador = None
+
+
+def barrer_quantum(carga, quantums, algoritmo=None, max_workers=None, paralelo=None, tam_bloque=None):
+    """
+    Ejecuta Round Robin con cada quantum de 'quantums'.
+
+    :param carga: Workload o lista de Process
+    :param quantums: iterable de quantums (> 0), p. ej. range(1, 201)
+    :param algoritmo: 'round_robin' o 'round_robin_blocking'; None = según si la carga
+                      tiene bloqueos (mismo criterio que la GUI)
+    :param max_workers: procesos trabajadores (por defecto os.cpu_count())
+    :param paralelo: True/False para forzar; None = en paralelo si hay más de un núcleo y
+                     suficiente trabajo (procesos x quantums >= UMBRAL_PARALELO)
+    :param tam_bloque: quantums por tarea (por defecto, ~4 bloques por trabajador)
+    :return: lista, en el orden de 'quantums', de dicts
+             {"quantum", "trm", "tem", "cambios_contexto"}
+    :raises ValueError: si el algoritmo no usa quantum o algún quantum no es > 0
+    """
+    carga = Workload.de(carga)
+    if algoritmo is None:
+        algoritmo = "round_robin_blocking" if carga.tiene_bloqueos() else "round_robin"
+    if not registro.requiere_quantum(algoritmo):
+        raise ValueError(f"El algoritmo '{algoritmo}' no usa quantum")
+    quantums = list(quantums)
+    if any(q <= 0 for q in quantums):
+        raise ValueError("Todos los quantums deben ser > 0")
+
+    # Quantums distintos a simular (los que superan la saturación comparten corrida)
+    saturacion = quantum_saturacion(carga, algoritmo)
+    a_simular = sorted({min(q, saturacion) for q in quantums})
+
+    trabajadores = max_workers or os.cpu_count() or 1
+    if paralelo is None:
+        paralelo = (trabajadores > 1 and len(a_simular) > 1
+                    and len(carga) * len(a_simular) >= UMBRAL_PARALELO)
+
+    if paralelo:
+        tam = tam_bloque or max(1, math.ceil(len(a_simular) / (trabajadores * 4)))
+        bloques = [a_simular[i:i + tam] for i in range(0, len(a_simular), tam)]
+        with ProcessPoolExecutor(max_workers=min(trabajadores, len(bloques)),
+                                 initializer=_iniciar_trabajador, initargs=(carga,)) as pool:
+            filas = [fila for parcial in mapear_en_pool(pool, _correr_bloque_en_trabajador,
+                                                        [algoritmo] * len(bloques), bloques)
+                     for fila in parcial]
+    else:
+        filas = _correr_bloque(algoritmo, carga, a_simular)
+
+    por_quantum = dict(zip(a_simular, filas))
+    return [dict(por_quantum[min(q, saturacion)], quantum=q) for q in quantums]
+
+
+def quantum_saturacion(carga, algoritmo):
+    """
+    Menor quantum a partir del cual el plan de Round Robin ya no depende del quantum.
+
+    - Sin bloqueos cada proceso ejecuta sólo su primera ráfaga: con quantum >= la mayor
+      de ellas nunca hay fin de quantum.
+    - Con bloqueos y saldo de quantum, el saldo de un proceso alcanza para todas sus
+      ráfagas si el quantum es >= su CPU total: nunca agota el quantum.
+    """
+    con_bloqueos = registro.ALGORITMOS[algoritmo][2]
+    maximo = 1
+    for _, _, bursts, _ in carga:
+        if con_bloqueos:
+            cpu = sum(b for b in bursts[0::2] if b > 0)
+        else:
+            cpu = bursts[0] if bursts else 0
+        maximo = max(maximo, cpu)
+    return maximo
+
+
+def _correr_bloque(algoritmo, carga, quantums):
+    filas = []
+    for q in quantums:
+        gantt, procesos = registro.ejecutar(algoritmo, carga, q)
+        _, trm, tem = calcular_metricas(procesos)
+        filas.append({"quantum": q, "trm": trm, "tem": tem,
+                      "cambios_contexto": contar_cambios_contexto(gantt)})
+        # En un trabajador no hay Seguimiento: no hace nada
+        avisar_tarea(len(filas), len(quantums))
+    return filas
+
+
+# ---------- Procesos trabajadores ----------
+def _iniciar_trabajador(carga):
+    global _carga_trabajador
+    _carga_trabajador = carga
+
+
+def _correr_bloque_en_trabajador(algoritmo, quantums):
+    return _correr_bloque(algoritmo, _carga_trabajador, quantums)
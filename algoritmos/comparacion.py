@@ -0,0 +1,112 @@
+# algoritmos/comparacion.py
+"""
+Comparación de varios algoritmos sobre una misma carga de trabajo.
+
+Los algoritmos se reparten en un ProcessPoolExecutor: la carga (inmutable) se envía
+una sola vez a cada proceso trabajador y cada tarea sólo lleva el nombre del
+algoritmo, así que el tiempo total se acerca al del algoritmo más lento en lugar de
+la suma de todos.
+
+Si la comparación corre con un Seguimiento activo (la GUI la lanza en un hilo), cada
+algoritmo terminado se informa con Seguimiento.tarea() y cancelar descarta los que
+faltan sin esperar a los que ya están corriendo en los trabajadores.
+"""
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from models.workload import Workload
+from utils.metricas import calcular_metricas
+
+from . import registro
+from .motor import SimulacionCancelada, avisar_tarea, seguimiento_actual
+
+# Con cargas chicas arrancar procesos cuesta más que simular: se corre en este proceso
+UMBRAL_PARALELO = 500
+# Segundos entre chequeos de cancelación mientras se espera a los trabajadores
+ESPERA_CANCELACION = 0.1
+
+# Carga recibida por cada proceso trabajador (ver _iniciar_trabajador)
+_carga_trabajador = None
+
+
+def comparar(carga, algoritmos, quantum=None, max_workers=None, paralelo=None):
+    """
+    Ejecuta cada algoritmo sobre la misma carga y junta los resultados.
+
+    :param carga: Workload o lista de Process
+    :param algoritmos: nombres del registro (ver algoritmos/registro.py)
+    :param quantum: quantum para los algoritmos que lo requieren
+    :param max_workers: procesos trabajadores (por defecto, uno por algoritmo hasta os.cpu_count())
+    :param paralelo: True/False para forzar; None = en paralelo si hay más de un algoritmo,
+                     la carga tiene al menos UMBRAL_PARALELO procesos y hay más de un núcleo
+    :return: lista (en el orden pedido, sin repetidos) de dicts con
+             {"algoritmo", "gantt", "procesos", "metricas", "trm", "tem"}
+    :raises ValueError: si un algoritmo no existe o falta el quantum
+    """
+    carga = Workload.de(carga)
+    nombres = list(dict.fromkeys(algoritmos))
+    for nombre in nombres:
+        if registro.requiere_quantum(nombre) and (quantum is None or quantum <= 0):
+            raise ValueError(f"El algoritmo '{nombre}' requiere un quantum > 0")
+
+    if paralelo is None:
+        paralelo = (len(nombres) > 1 and len(carga) >= UMBRAL_PARALELO
+                    and (os.cpu_count() or 1) > 1)
+
+    if paralelo:
+        trabajadores = min(len(nombres), max_workers or os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=trabajadores, initializer=_iniciar_trabajador,
+                                 initargs=(carga,)) as pool:
+            resultados = mapear_en_pool(pool, _correr_en_trabajador, nombres, [quantum] * len(nombres))
+    else:
+        resultados = []
+        for nombre in nombres:
+            resultados.append(_correr(nombre, carga, quantum))
+            avisar_tarea(len(resultados), len(nombres))
+
+    return [
+        {"algoritmo": nombre, "gantt": gantt, "procesos": procesos,
+         "metricas": metricas, "trm": trm, "tem": tem}
+        for nombre, (gantt, procesos, metricas, trm, tem) in zip(nombres, resultados)
+    ]
+
+
+def mapear_en_pool(pool, funcion, *iterables):
+    """
+    Como list(pool.map(funcion, *iterables)), pero atento al Seguimiento del hilo.
+
+    Con un Seguimiento activo avisa cada tarea terminada y, si se pidió cancelar,
+    descarta las pendientes y lanza SimulacionCancelada sin esperar a las que ya
+    corren (terminan solas en sus trabajadores).
+    """
+    seguimiento = seguimiento_actual()
+    if seguimiento is None:
+        return list(pool.map(funcion, *iterables))
+
+    futuros = [pool.submit(funcion, *argumentos) for argumentos in zip(*iterables)]
+    pendientes = set(futuros)
+    while pendientes:
+        if seguimiento.cancelado:
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise SimulacionCancelada()
+        _, pendientes = wait(pendientes, timeout=ESPERA_CANCELACION, return_when=FIRST_COMPLETED)
+        if seguimiento.al_tarea is not None:
+            seguimiento.al_tarea(len(futuros) - len(pendientes), len(futuros))
+    return [futuro.result() for futuro in futuros]
+
+
+def _correr(nombre, carga, quantum):
+    q = quantum if registro.requiere_quantum(nombre) else None
+    gantt, procesos = registro.ejecutar(nombre, carga, q)
+    metricas, trm, tem = calcular_metricas(procesos)
+    return gantt, procesos, metricas, trm, tem
+
+
+# ---------- Procesos trabajadores ----------
+def _iniciar_trabajador(carga):
+    global _carga_trabajador
+    _carga_trabajador = carga
+
+
+def _correr_en_trabajador(nombre, quantum):
+    return _correr(nombre, _carga_trabajador, quantum)
@@ -0,0 +1,395 @@
+# algoritmos/motor.py
+import heapq
+import threading
+from itertools import count
+
+from models.gantt import Gantt
+from models.workload import Workload
+
+from . import reproduccion
+from .reproduccion import grabacion_actual
+
+# Clases de evento. En un mismo instante se atienden en este orden:
+#   1) fin de ráfaga / fin de quantum del proceso en CPU
+#   2) llegadas
+#   3) desbloqueos
+#   4) chequeo de expulsión (sólo políticas expulsivas)
+# Las llegadas no pasan por el heap de eventos: se leen de un arreglo ordenado con un
+# cursor. Los desbloqueos tampoco: viven en la cola de bloqueados (ColaBloqueados).
+FIN_CPU = 0
+LLEGADA = 1
+DESBLOQUEO = 2
+EXPULSION = 3
+
+# Pasos del bucle de eventos entre dos avisos de progreso (ver Seguimiento)
+PASOS_POR_AVISO = 4096
+
+_hilo = threading.local()
+
+
+class SimulacionCancelada(Exception):
+    """La corrida se canceló con Seguimiento.cancelar()."""
+
+
+class Seguimiento:
+    """
+    Progreso y cancelación de las corridas del motor hechas en un hilo.
+
+    Se activa con 'with' en el hilo que simula; toda corrida del motor en ese bloque
+    (también las que pasan por registro.ejecutar o la caché) llama cada
+    PASOS_POR_AVISO pasos a al_progresar(tiempo, completados, total) y, si desde otro
+    hilo se llamó a cancelar(), se corta con SimulacionCancelada. Las corridas por
+    lotes (comparación, barrido de quantum) además llaman a al_tarea(hechas, total)
+    al terminar cada simulación o bloque. Los avisos corren en el hilo que simula: la
+    GUI debe pasar los datos a Tk con after().
+    """
+
+    def __init__(self, al_progresar=None, pasos_por_aviso=PASOS_POR_AVISO, al_tarea=None):
+        self.al_progresar = al_progresar
+        self.al_tarea = al_tarea
+        self.pasos_por_aviso = pasos_por_aviso
+        self._cancelado = threading.Event()
+        self._anterior = None
+
+    def cancelar(self):
+        """Pide cortar la corrida en curso (se puede llamar desde cualquier hilo)."""
+        self._cancelado.set()
+
+    @property
+    def cancelado(self):
+        return self._cancelado.is_set()
+
+    def avisar(self, tiempo, completados, total):
+        """Informa el avance; lanza SimulacionCancelada si se pidió cancelar."""
+        if self._cancelado.is_set():
+            raise SimulacionCancelada()
+        if self.al_progresar is not None:
+            self.al_progresar(tiempo, completados, total)
+
+    def tarea(self, hechas, total):
+        """Informa cuántas tareas de un lote terminaron; lanza SimulacionCancelada si se pidió cancelar."""
+        if self._cancelado.is_set():
+            raise SimulacionCancelada()
+        if self.al_tarea is not None:
+            self.al_tarea(hechas, total)
+
+    def __enter__(self):
+        self._anterior = getattr(_hilo, "seguimiento", None)
+        _hilo.seguimiento = self
+        return self
+
+    def __exit__(self, *exc):
+        _hilo.seguimiento = self._anterior
+        return False
+
+
+def seguimiento_actual():
+    """Seguimiento activo en este hilo, o None."""
+    return getattr(_hilo, "seguimiento", None)
+
+
+def avisar_tarea(hechas, total):
+    """Avisa al Seguimiento activo en este hilo (si hay) que terminó una tarea de un lote."""
+    seguimiento = seguimiento_actual()
+    if seguimiento is not None:
+        seguimiento.tarea(hechas, total)
+
+
+class ColaBloqueados:
+    """
+    Conjunto de procesos bloqueados (E/S): min-heap por instante de desbloqueo.
+
+    Bloquear y desbloquear cuestan O(log n) y todos los procesos que se desbloquean
+    hasta un instante salen en un solo lote, ordenados por instante, por el desempate
+    de la política y, por último, por orden de bloqueo.
+    """
+
+    def __init__(self):
+        self._heap = []            # [(desbloqueo, desempate, orden_de_bloqueo, proceso)]
+        self._orden = count()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def bloquear(self, proceso, hasta, desempate=0):
+        """Registra que 'proceso' queda bloqueado hasta el instante 'hasta'."""
+        heapq.heappush(self._heap, (hasta, desempate, next(self._orden), proceso))
+
+    def proximo(self):
+        """Instante del próximo desbloqueo (None si no hay bloqueados)."""
+        return self._heap[0][0] if self._heap else None
+
+    def extraer_hasta(self, tiempo):
+        """Saca, en orden, todos los procesos cuyo desbloqueo es <= tiempo."""
+        heap = self._heap
+        lote = []
+        while heap and heap[0][0] <= tiempo:
+            lote.append(heapq.heappop(heap)[3])
+        return lote
+
+
+def simular(process_list, politica, con_bloqueos=True, con_tipo=True,
+            registrar_idle=False, fusionar_tramos=False):
+    """
+    MOTOR DE SIMULACIÓN POR EVENTOS DISCRETOS
+
+    Todos los algoritmos de 'algoritmos/' se ejecutan sobre este motor. En lugar de
+    avanzar el reloj de a una unidad, el motor mantiene un heap de eventos ordenado
+    por tiempo (llegada, fin de ráfaga de CPU, desbloqueo, fin de quantum, chequeo de
+    expulsión) y salta directamente al próximo evento. El costo depende de la cantidad
+    de eventos, no de la duración total de la simulación.
+
+    Cada algoritmo aporta su política de cola de listos (ver algoritmos/politicas.py).
+
+    PARÁMETROS:
+    - process_list: Workload, o lista de objetos Process (no se modifica). Cada corrida
+      crea sus propios procesos con Workload.instanciar(); pasar un Workload ya armado
+      evita reconstruirlo cuando se corren varios algoritmos sobre la misma carga.
+    - politica: Cola de listos (ColaFIFO, ColaPorClave, ColaRoundRobin, ...)
+    - con_bloqueos: False = cada proceso ejecuta sólo su primera ráfaga de CPU
+    - con_tipo: True = tuplas (pid, start, end, tipo); False = (pid, start, end)
+    - registrar_idle: registrar los períodos de CPU ociosa como tramos "IDLE"
+    - fusionar_tramos: unir tramos consecutivos del mismo pid (o IDLE) en el Gantt
+
+    RETORNA:
+    - gantt: Gantt (models/gantt.py) en columnas; se usa como la lista de tuplas de antes
+    - processes: Lista de procesos con métricas calculadas
+
+    Dentro de un 'with Seguimiento(...)' informa el avance y puede cancelarse (lanza
+    SimulacionCancelada); dentro de un 'with Grabacion()' (algoritmos/reproduccion.py)
+    anota la corrida para reproducirla paso a paso.
+    """
+    processes = Workload.de(process_list).instanciar()
+    sim = _Simulacion(processes, politica, con_bloqueos, con_tipo, registrar_idle, fusionar_tramos)
+    sim.ejecutar()
+    return sim.gantt, processes
+
+
+class _Simulacion:
+    """Estado de una corrida del motor (reloj, heap de eventos, CPU y Gantt)."""
+
+    def __init__(self, processes, politica, con_bloqueos, con_tipo, registrar_idle, fusionar_tramos):
+        self.processes = processes
+        self.politica = politica
+        self.con_bloqueos = con_bloqueos
+        self.con_tipo = con_tipo
+        self.registrar_idle = registrar_idle
+        self.fusionar_tramos = fusionar_tramos
+
+        self.tiempo = 0
+        self.completados = 0
+        self.gantt = Gantt(con_tipo)
+        self.eventos = []              # heap: (tiempo, clase, desempate, seq, proceso, dato)
+        self.bloqueados = ColaBloqueados()
+        self._seq_evento = count()
+
+        # CPU
+        self.actual = None             # proceso en ejecución
+        self.inicio_tramo = None       # inicio del tramo de CPU vigente
+        self.consumido_hasta = None    # hasta dónde se descontó la ráfaga del actual
+        self.despacho = 0              # id del despacho vigente (invalida FIN_CPU viejos)
+        self.chequeo_pendiente = None  # instante con chequeo de expulsión ya programado
+        self.ultimo_tramo = None       # (índice, pid, fin) del último tramo CPU/IDLE del Gantt
+
+        self.grabacion = grabacion_actual()
+        if self.grabacion is not None:
+            self.grabacion.iniciar(p.pid for p in processes)
+
+        for idx, p in enumerate(processes):
+            p._seq = idx
+            p.start_time = None
+            p.completion_time = None
+
+    # ---------- Eventos ----------
+    def _programar(self, tiempo, clase, desempate, proceso, dato=None):
+        heapq.heappush(self.eventos, (tiempo, clase, desempate, next(self._seq_evento), proceso, dato))
+
+    def _descartar_obsoletos(self):
+        """Quita del tope del heap los FIN_CPU de despachos que ya no están vigentes."""
+        eventos = self.eventos
+        while eventos and eventos[0][1] == FIN_CPU and (
+                eventos[0][4] is not self.actual or eventos[0][5] != self.despacho):
+            heapq.heappop(eventos)
+
+    def ejecutar(self):
+        politica = self.politica
+        # Llegadas pre-ordenadas (tiempo, desempate de la política, orden de definición)
+        # y consumidas con un cursor: admitir llegadas cuesta sólo lo que se admite y
+        # el heap de eventos queda sólo con fin de CPU y chequeos de expulsión.
+        llegadas = sorted(self.processes,
+                          key=lambda p: (p.arrival_time, politica.clave_llegada(p), p._seq))
+        n_llegadas = len(llegadas)
+        cursor = 0
+
+        eventos = self.eventos
+        bloqueados = self.bloqueados
+        seguimiento = seguimiento_actual()
+        total = len(self.processes)
+        pasos = 0
+        while True:
+            if seguimiento is not None:
+                pasos += 1
+                if pasos >= seguimiento.pasos_por_aviso:
+                    pasos = 0
+                    seguimiento.avisar(self.tiempo, self.completados, total)
+
+            # Despachar si la CPU está libre y hay listos
+            if self.actual is None and len(politica):
+                self._despachar()
+
+            self._descartar_obsoletos()
+            candidatos = []
+            if cursor < n_llegadas:
+                candidatos.append(llegadas[cursor].arrival_time)
+            if eventos:
+                candidatos.append(eventos[0][0])
+            if bloqueados:
+                candidatos.append(bloqueados.proximo())
+            if not candidatos:
+                if seguimiento is not None:
+                    seguimiento.avisar(self.tiempo, self.completados, total)
+                break
+            t_sig = min(candidatos)
+
+            # Saltar directamente al próximo evento
+            if t_sig > self.tiempo:
+                if self.actual is None and self.registrar_idle:
+                    self._tramo("IDLE", self.tiempo, t_sig, "IDLE")
+                self.tiempo = t_sig
+
+            # Atender todos los eventos de este instante, por clase:
+            # fin de CPU, llegadas, desbloqueos y chequeo de expulsión
+            while eventos and eventos[0][0] <= self.tiempo and eventos[0][1] < LLEGADA:
+                self._atender(heapq.heappop(eventos))
+            while cursor < n_llegadas and llegadas[cursor].arrival_time <= self.tiempo:
+                self._llegada(llegadas[cursor])
+                cursor += 1
+            if bloqueados and bloqueados.proximo() <= self.tiempo:
+                for p in bloqueados.extraer_hasta(self.tiempo):
+                    if self.grabacion is not None:
+                        self.grabacion.registrar(self.tiempo, reproduccion.DESBLOQUEO, p._seq)
+                    p.advance_burst()  # salir del BLOQ
+                    self._transicion(p, "desbloqueo")
+            while eventos and eventos[0][0] <= self.tiempo:
+                self._atender(heapq.heappop(eventos))
+
+    def _atender(self, evento):
+        _, clase, _, _, proceso, dato = evento
+        if clase == FIN_CPU:
+            if proceso is self.actual and dato == self.despacho:
+                self._fin_cpu()
+        else:
+            self._chequear_expulsion()
+
+    # ---------- CPU ----------
+    def _despachar(self):
+        p = self.politica.siguiente(self.tiempo)
+        self.actual = p
+        self.inicio_tramo = self.tiempo
+        self.consumido_hasta = self.tiempo
+        if p.start_time is None:
+            p.start_time = self.tiempo  # primera vez en CPU
+        if self.grabacion is not None:
+            self.grabacion.registrar(self.tiempo, reproduccion.DESPACHO, p._seq)
+
+        quantum = self.politica.quantum_para(p)
+        duracion = p.remaining_time if quantum is None else min(quantum, p.remaining_time)
+        self.despacho += 1
+        self._programar(self.tiempo + duracion, FIN_CPU, 0, p, self.despacho)
+
+    def _consumir(self):
+        """Descuenta de la ráfaga viva del proceso en CPU el tiempo ejecutado."""
+        p = self.actual
+        transcurrido = self.tiempo - self.consumido_hasta
+        if transcurrido:
+            p.consume_cpu(transcurrido)
+            self.consumido_hasta = self.tiempo
+
+    def _liberar_cpu(self):
+        p = self.actual
+        self._consumir()
+        self._tramo(p.pid, self.inicio_tramo, self.tiempo, "CPU")
+        usado = self.tiempo - self.inicio_tramo
+        self.actual = None
+        if self.grabacion is not None:
+            self.grabacion.registrar(self.tiempo, reproduccion.LIBERA, p._seq)
+        return p, usado
+
+    def _fin_cpu(self):
+        p, usado = self._liberar_cpu()
+        if p.remaining_time > 0:
+            # Fin de quantum: vuelve a listos
+            self.politica.al_liberar(p, usado, False)
+            self._a_listos(p, "expulsion")
+            return
+
+        # Fin de ráfaga de CPU
+        self.politica.al_liberar(p, usado, True)
+        if not self.con_bloqueos:
+            self._completar(p)
+            return
+        p.advance_burst()
+        self._transicion(p, "cpu")
+
+    def _chequear_expulsion(self):
+        self.chequeo_pendiente = None
+        if self.actual is None:
+            return
+        self._consumir()
+        if self.politica.debe_expulsar(self.actual):
+            p, _ = self._liberar_cpu()
+            self._a_listos(p, "expulsion")
+
+    # ---------- Transiciones ----------
+    def _llegada(self, p):
+        if not self.con_bloqueos:
+            if p.remaining_time > 0:
+                self._a_listos(p, "llegada")
+            else:
+                self._completar(p)
+            return
+        self._transicion(p, "llegada")
+
+    def _transicion(self, p, origen):
+        """Resuelve qué hace el proceso en su ráfaga actual: listos, bloqueo o fin."""
+        # Saltar ráfagas de duración 0 encadenadas
+        while p.current_burst_index < len(p.bursts) and p.bursts[p.current_burst_index] == 0:
+            p.advance_burst()
+
+        if p.current_burst_index >= len(p.bursts):
+            self._completar(p)
+        elif p.is_cpu_burst():
+            self._a_listos(p, origen)
+        else:
+            dur = p.bursts[p.current_burst_index]
+            self._tramo(p.pid, self.tiempo, self.tiempo + dur, "BLOCK")
+            self.bloqueados.bloquear(p, self.tiempo + dur, self.politica.clave_desbloqueo(p))
+            if self.grabacion is not None:
+                self.grabacion.registrar(self.tiempo, reproduccion.BLOQUEO, p._seq, self.tiempo + dur)
+
+    def _a_listos(self, p, origen):
+        self.politica.encolar(p, self.tiempo, origen)
+        if self.grabacion is not None:
+            self.grabacion.registrar(self.tiempo, reproduccion.LISTO, p._seq)
+        if self.politica.expulsiva and self.actual is not None and self.chequeo_pendiente != self.tiempo:
+            self.chequeo_pendiente = self.tiempo
+            self._programar(self.tiempo, EXPULSION, 0, None)
+
+    def _completar(self, p):
+        p.completion_time = self.tiempo
+        p.calculate_metrics()
+        self.completados += 1
+        if self.grabacion is not None:
+            self.grabacion.registrar(self.tiempo, reproduccion.FIN, p._seq)
+
+    # ---------- Gantt ----------
+    def _tramo(self, pid, inicio, fin, tipo):
+        if tipo != "BLOCK":
+            if self.fusionar_tramos and self.ultimo_tramo is not None:
+                idx, pid_previo, fin_previo = self.ultimo_tramo
+                if pid_previo == pid and fin_previo == inicio:
+                    self.gantt.extender(idx, fin)
+                    self.ultimo_tramo = (idx, pid, fin)
+                    return
+            self.ultimo_tramo = (len(self.gantt), pid, fin)
+        self.gantt.agregar(pid, inicio, fin, tipo)
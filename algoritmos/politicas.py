@@ -0,0 +1,162 @@
+# algoritmos/politicas.py
+import heapq
+from collections import deque
+from itertools import count
+
+
+class ColaFIFO:
+    """
+    Política de cola de listos FIFO (base de todas las políticas del motor).
+
+    El motor (algoritmos/motor.py) sólo habla con la cola de listos a través de
+    estos métodos, por lo que cada algoritmo se define eligiendo una política:
+      - encolar / siguiente: entrada y salida de la cola de listos
+      - quantum_para / al_liberar: control del tramo de CPU (Round Robin)
+      - debe_expulsar: criterio de expulsión (SRTF)
+      - clave_llegada / clave_desbloqueo: desempate de eventos simultáneos
+    """
+
+    expulsiva = False  # True si una llegada/desbloqueo puede expulsar al proceso en CPU
+
+    def __init__(self):
+        self._cola = deque()
+
+    def __len__(self):
+        return len(self._cola)
+
+    def encolar(self, proceso, tiempo, origen):
+        """Agrega un proceso a listos. origen: 'llegada', 'cpu', 'desbloqueo' o 'expulsion'."""
+        self._cola.append(proceso)
+
+    def siguiente(self, tiempo):
+        """Saca de listos el próximo proceso a despachar."""
+        return self._cola.popleft()
+
+    def quantum_para(self, proceso):
+        """Duración máxima del tramo de CPU (None = hasta terminar la ráfaga)."""
+        return None
+
+    def al_liberar(self, proceso, usado, fin_rafaga):
+        """Aviso de que el proceso dejó la CPU tras usar 'usado' unidades."""
+
+    def debe_expulsar(self, actual):
+        """True si hay en listos un proceso que debe expulsar al actual."""
+        return False
+
+    def clave_llegada(self, proceso):
+        """Desempate entre llegadas del mismo instante (por defecto: orden de definición)."""
+        return proceso._seq
+
+    def clave_desbloqueo(self, proceso):
+        """Desempate entre desbloqueos del mismo instante (por defecto: orden de bloqueo)."""
+        return 0
+
+
+class ColaPorClave(ColaFIFO):
+    """
+    Cola de listos ordenada por una clave (SJF, SRTF, Prioridades).
+
+    Se despacha siempre el proceso de menor clave; ante claves iguales, el que
+    entró antes a listos (igual que el sort estable de las versiones originales).
+
+    Los listos se guardan en un heap y la clave se calcula UNA vez, al entrar a
+    listos (llegada, desbloqueo, fin de CPU o expulsión). Mientras un proceso espera
+    su clave no cambia, así que despachar cuesta O(log n) y el chequeo de expulsión
+    es O(1): sólo se compara el tope del heap contra el proceso en CPU.
+    """
+
+    def __init__(self, clave, expulsiva=False):
+        super().__init__()
+        self.clave = clave
+        self.expulsiva = expulsiva
+        self._heap = []            # [(clave, orden_de_ingreso, proceso)]
+        self._orden = count()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def encolar(self, proceso, tiempo, origen):
+        heapq.heappush(self._heap, (self.clave(proceso), next(self._orden), proceso))
+
+    def siguiente(self, tiempo):
+        return heapq.heappop(self._heap)[2]
+
+    def debe_expulsar(self, actual):
+        return bool(self._heap) and self._heap[0][0] < self.clave(actual)
+
+
+class ColaRoundRobin(ColaFIFO):
+    """
+    Cola FIFO con quantum.
+
+    :param quantum: duración máxima de cada tramo de CPU
+    :param conservar_saldo: si la ráfaga termina (o el proceso se bloquea) antes de
+                            agotar el quantum, el sobrante se conserva para su próxima
+                            entrada a CPU; si agota el quantum vuelve con quantum completo
+    :param llegadas_por_pid: las llegadas acumuladas mientras la CPU estaba ocupada se
+                             encolan ordenadas por PID y antes que el proceso expulsado
+                             por quantum (criterio de Round Robin sin bloqueos)
+    :param clave_orden: función pid -> clave para desempatar llegadas y desbloqueos
+                        simultáneos (None = orden de definición / de bloqueo)
+    """
+
+    def __init__(self, quantum, conservar_saldo=False, llegadas_por_pid=False, clave_orden=None):
+        super().__init__()
+        self.quantum = quantum
+        self.conservar_saldo = conservar_saldo
+        self.llegadas_por_pid = llegadas_por_pid
+        self.clave_orden = clave_orden
+        self._saldo = {}            # pid -> crédito de quantum pendiente
+        self._asignado = None       # quantum otorgado en el despacho vigente
+        self._llegadas = []         # llegadas pendientes de volcar (llegadas_por_pid)
+        self._expulsado = None      # proceso expulsado pendiente de volcar (llegadas_por_pid)
+
+    def __len__(self):
+        return len(self._cola) + len(self._llegadas) + (self._expulsado is not None)
+
+    def encolar(self, proceso, tiempo, origen):
+        if self.llegadas_por_pid and origen == "llegada":
+            self._llegadas.append(proceso)
+        elif self.llegadas_por_pid and origen == "expulsion":
+            self._expulsado = proceso
+        else:
+            self._cola.append(proceso)
+
+    def _volcar(self):
+        if self._llegadas:
+            self._llegadas.sort(key=lambda p: p.pid)
+            self._cola.extend(self._llegadas)
+            self._llegadas.clear()
+        if self._expulsado is not None:
+            self._cola.append(self._expulsado)
+            self._expulsado = None
+
+    def siguiente(self, tiempo):
+        self._volcar()
+        return self._cola.popleft()
+
+    def quantum_para(self, proceso):
+        if self.conservar_saldo:
+            self._asignado = self._saldo.get(proceso.pid, self.quantum)
+        else:
+            self._asignado = self.quantum
+        return self._asignado
+
+    def al_liberar(self, proceso, usado, fin_rafaga):
+        if not self.conservar_saldo:
+            return
+        if fin_rafaga:
+            sobrante = self._asignado - usado
+            self._saldo[proceso.pid] = sobrante if sobrante > 0 else self.quantum
+        else:
+            self._saldo.pop(proceso.pid, None)
+
+    def clave_llegada(self, proceso):
+        if self.clave_orden is None:
+            return proceso._seq
+        return self.clave_orden(proceso.pid)
+
+    def clave_desbloqueo(self, proceso):
+        if self.clave_orden is None:
+            return 0
+        return self.clave_orden(proceso.pid)
@@ -0,0 +1,70 @@
+# algoritmos/registro.py
+"""
+Registro de algoritmos disponibles, por nombre.
+
+Permite elegir y ejecutar cualquier algoritmo de 'algoritmos/' sin depender de la
+GUI (CLI, comparaciones, barridos). Cada entrada indica si el algoritmo necesita
+quantum y si simula bloqueos (E/S).
+"""
+from .fifo import fifo
+from .fifo_blocking import fifo_blocking
+from .sjf import sjf
+from .sjf_blocking import sjf_blocking
+from .srtf import srtf
+from .srtf_blocking import srtf_blocking
+from .roundrobin import round_robin
+from .round_robin_blocking import round_robin_blocking
+from .priority import priority
+from .priority_blocking import priority_blocking
+
+# Se incrementa cuando cambia el resultado de algún algoritmo (invalida la caché de
+# resultados, ver utils/cache.py)
+VERSION_MOTOR = 1
+
+# nombre -> (función, requiere_quantum, con_bloqueos)
+ALGORITMOS = {
+    "fifo": (fifo, False, False),
+    "fifo_blocking": (fifo_blocking, False, True),
+    "sjf": (sjf, False, False),
+    "sjf_blocking": (sjf_blocking, False, True),
+    "srtf": (srtf, False, False),
+    "srtf_blocking": (srtf_blocking, False, True),
+    "round_robin": (round_robin, True, False),
+    "round_robin_blocking": (round_robin_blocking, True, True),
+    "priority": (priority, False, False),
+    "priority_blocking": (priority_blocking, False, True),
+}
+
+
+def nombres():
+    """Nombres registrados, en orden de presentación."""
+    return list(ALGORITMOS)
+
+
+def requiere_quantum(nombre):
+    """True si el algoritmo 'nombre' necesita quantum (Round Robin)."""
+    return _buscar(nombre)[1]
+
+
+def ejecutar(nombre, carga, quantum=None):
+    """
+    Ejecuta el algoritmo 'nombre' sobre 'carga' (Workload o lista de Process).
+
+    :return: (gantt, processes), igual que la función del algoritmo
+    :raises ValueError: si el algoritmo no existe o falta un quantum válido
+    """
+    funcion, con_quantum, _ = _buscar(nombre)
+    if con_quantum:
+        if quantum is None or quantum <= 0:
+            raise ValueError(f"El algoritmo '{nombre}' requiere un quantum > 0")
+        return funcion(carga, quantum)
+    return funcion(carga)
+
+
+def _buscar(nombre):
+    try:
+        return ALGORITMOS[nombre]
+    except KeyError:
+        raise ValueError(
+            f"Algoritmo desconocido: '{nombre}'. Opciones: {', '.join(ALGORITMOS)}"
+        ) from None
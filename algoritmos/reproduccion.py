@@ -0,0 +1,177 @@
+# algoritmos/reproduccion.py
+"""
+Grabación de una corrida del motor para reproducirla paso a paso.
+
+Mientras hay una Grabacion activa ('with' en el hilo que simula), el motor anota cada
+cambio de estado (entra a listos, se despacha, deja la CPU, se bloquea, se desbloquea,
+termina) en una bitácora en columnas, y cada tanto guarda un punto de control con el
+estado completo: proceso en CPU, cola de listos y bloqueados.
+
+estado_en(t) parte del último punto de control anterior a t y reaplica sólo los
+eventos que siguen, así que ir a cualquier instante cuesta a lo sumo un intervalo
+entre puntos, no volver a simular. El intervalo crece con el tamaño del estado (un
+punto cuesta lo mismo que copiar ese estado), de modo que los puntos nunca ocupan
+más que la bitácora misma.
+
+La cola de listos se muestra en orden de entrada; las políticas por clave (SJF,
+SRTF, prioridades) eligen de ella según su clave, no según ese orden.
+"""
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+
+# Eventos de la bitácora (columna 'evento', un byte por evento)
+LISTO = 0        # entra a la cola de listos
+DESPACHO = 1     # sale de listos y toma la CPU
+LIBERA = 2       # deja la CPU (fin de ráfaga, de quantum o expulsión)
+BLOQUEO = 3      # queda bloqueado (dato = instante de desbloqueo)
+DESBLOQUEO = 4   # sale de bloqueados
+FIN = 5          # termina
+
+# Eventos mínimos entre dos puntos de control
+INTERVALO_PUNTOS = 256
+
+_hilo = threading.local()
+
+
+def grabacion_actual():
+    """Grabacion activa en este hilo, o None."""
+    return getattr(_hilo, "grabacion", None)
+
+
+def grabar(algoritmo, carga, quantum=None, intervalo=INTERVALO_PUNTOS):
+    """
+    Ejecuta un algoritmo del registro grabando la corrida.
+
+    :return: (gantt, processes, grabacion)
+    """
+    from . import registro
+    with Grabacion(intervalo) as grabacion:
+        gantt, processes = registro.ejecutar(algoritmo, carga, quantum)
+    return gantt, processes, grabacion
+
+
+class Grabacion:
+    """Bitácora de eventos y puntos de control de la última corrida del motor en el bloque 'with'."""
+
+    def __init__(self, intervalo=INTERVALO_PUNTOS):
+        self.intervalo = intervalo
+        self._anterior = None
+        self.iniciar(())
+
+    def __enter__(self):
+        self._anterior = grabacion_actual()
+        _hilo.grabacion = self
+        return self
+
+    def __exit__(self, *exc):
+        _hilo.grabacion = self._anterior
+        return False
+
+    # ---------- Grabación (la llama el motor) ----------
+    def iniciar(self, pids):
+        """Empieza una corrida nueva; los procesos se identifican por su posición en 'pids'."""
+        self.pids = tuple(pids)
+        self._tiempo = array("q")
+        self._evento = array("B")
+        self._proceso = array("i")
+        self._dato = array("q")
+        # Estado vivo: se copia en cada punto de control
+        self._actual = -1
+        self._listos = {}          # índice -> None (conjunto ordenado por entrada)
+        self._bloqueados = {}      # índice -> instante de desbloqueo
+        self._terminados = 0
+        self._puntos = [self._punto()]   # estado antes del evento _inicio_puntos[k]
+        self._inicio_puntos = [0]
+        self._proximo_punto = self.intervalo
+
+    def registrar(self, tiempo, evento, proceso, dato=0):
+        """Anota el evento y lo aplica al estado vivo."""
+        n = len(self._evento)
+        if n >= self._proximo_punto:
+            self._puntos.append(self._punto())
+            self._inicio_puntos.append(n)
+            self._proximo_punto = n + max(self.intervalo, len(self._listos) + len(self._bloqueados))
+        try:
+            self._tiempo.append(tiempo)
+            self._dato.append(dato)
+        except TypeError:
+            # Tiempos no enteros: las columnas de tiempo pasan a punto flotante
+            self._tiempo = array("d", self._tiempo[:n])
+            self._dato = array("d", self._dato[:n])
+            self._tiempo.append(tiempo)
+            self._dato.append(dato)
+        self._evento.append(evento)
+        self._proceso.append(proceso)
+        self._actual, self._terminados = _aplicar(
+            evento, proceso, dato, self._actual, self._listos, self._bloqueados, self._terminados)
+
+    def _punto(self):
+        return (self._actual, tuple(self._listos),
+                tuple(self._bloqueados.items()), self._terminados)
+
+    # ---------- Consultas ----------
+    def __len__(self):
+        return len(self._evento)
+
+    @property
+    def puntos_de_control(self):
+        return len(self._puntos)
+
+    def duracion(self):
+        """Instante del último evento (0 si no hay eventos)."""
+        return self._tiempo[-1] if len(self._tiempo) else 0
+
+    def instante_siguiente(self, t):
+        """Primer instante con eventos posterior a t (o t si no hay más)."""
+        i = bisect_right(self._tiempo, t)
+        return self._tiempo[i] if i < len(self._tiempo) else t
+
+    def instante_anterior(self, t):
+        """Último instante con eventos anterior a t (o 0 si no hay)."""
+        i = bisect_left(self._tiempo, t)
+        return self._tiempo[i - 1] if i else 0
+
+    def estado_en(self, t):
+        """
+        Estado después de atender los eventos del instante t.
+
+        :return: dict con "tiempo", "ejecutando" (pid o None), "listos" (pids en orden
+                 de entrada), "bloqueados" ([(pid, hasta)] por instante de desbloqueo)
+                 y "terminados" (cantidad)
+        """
+        hasta = bisect_right(self._tiempo, t)
+        k = bisect_right(self._inicio_puntos, hasta) - 1
+        desde = self._inicio_puntos[k]
+        actual, listos, bloqueados, terminados = self._puntos[k]
+        listos = dict.fromkeys(listos)
+        bloqueados = dict(bloqueados)
+        for i in range(desde, hasta):
+            actual, terminados = _aplicar(self._evento[i], self._proceso[i], self._dato[i],
+                                          actual, listos, bloqueados, terminados)
+        pids = self.pids
+        return {
+            "tiempo": t,
+            "ejecutando": pids[actual] if actual >= 0 else None,
+            "listos": [pids[i] for i in listos],
+            "bloqueados": sorted(((pids[i], h) for i, h in bloqueados.items()), key=lambda b: b[1]),
+            "terminados": terminados,
+        }
+
+
+def _aplicar(evento, proceso, dato, actual, listos, bloqueados, terminados):
+    """Aplica un evento de la bitácora; devuelve (actual, terminados) y modifica los dicts."""
+    if evento == LISTO:
+        listos[proceso] = None
+    elif evento == DESPACHO:
+        listos.pop(proceso, None)
+        actual = proceso
+    elif evento == LIBERA:
+        actual = -1
+    elif evento == BLOQUEO:
+        bloqueados[proceso] = dato
+    elif evento == DESBLOQUEO:
+        bloqueados.pop(proceso, None)
+    elif evento == FIN:
+        terminados += 1
+    return actual, terminados
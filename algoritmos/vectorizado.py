@@ -0,0 +1,124 @@
+# algoritmos/vectorizado.py
+"""
+Camino rápido vectorizado (NumPy) para FIFO y SJF no expulsivos SIN bloqueos.
+
+Cuando cada proceso tiene una sola ráfaga de CPU, el plan se deduce de un orden de
+despacho y una suma acumulada:
+
+    fin_i = C_i + max(0, max_{j<=i} (llegada_j - C_{j-1}))      con C = cumsum(ráfagas)
+
+que es la forma cerrada de fin_i = max(llegada_i, fin_{i-1}) + ráfaga_i (el reloj del
+motor arranca en 0). Gantt, finalización, TR y TE salen de unas pocas operaciones
+sobre arreglos, sin estado por unidad de tiempo.
+
+Las funciones devuelven None cuando el caso no aplica (NumPy no instalado, más de una
+ráfaga no nula, ráfaga de CPU no positiva, tiempos no enteros, o un orden SJF que
+depende de las llegadas, o una corrida que se está grabando para reproducirla); el
+algoritmo cae entonces al motor de eventos, que da el mismo resultado.
+"""
+from models.gantt import Gantt
+
+from .reproduccion import grabacion_actual
+
+try:
+    import numpy as np
+except ImportError:  # sin NumPy: siempre se usa el motor de eventos
+    np = None
+
+
+def fifo_vectorizado(carga):
+    """FIFO sobre un Workload: (gantt, processes) o None si el caso no aplica."""
+    datos = _arreglos(carga)
+    if datos is None:
+        return None
+    llegadas, rafagas = datos
+
+    # Orden de despacho = orden de llegada (estable: empates por orden de definición)
+    orden = np.argsort(llegadas, kind="stable")
+    return _armar(carga, orden, llegadas, rafagas, por_llegada=True)
+
+
+def sjf_vectorizado(carga):
+    """SJF sobre un Workload: (gantt, processes) o None si el caso no aplica."""
+    datos = _arreglos(carga)
+    if datos is None:
+        return None
+    llegadas, rafagas = datos
+
+    # Orden candidato: clave SJF (ráfaga, llegada, orden de definición)
+    orden = np.lexsort((np.arange(len(llegadas)), llegadas, rafagas))
+    a = llegadas[orden]
+    _, fin = _plan(a, rafagas[orden])
+
+    # El orden candidato es el que elegiría el motor salvo que la CPU quede libre antes
+    # de que llegue el proceso siguiente y, mientras tanto, llegue otro de clave mayor.
+    # Si hay un hueco antes del i-ésimo, éste debe ser el primero en llegar de los que faltan.
+    fin_previo = np.concatenate(([0], fin[:-1]))
+    min_siguientes = np.concatenate((np.minimum.accumulate(a[::-1])[::-1][1:], [a[-1]]))
+    if np.any((a > fin_previo) & (a > min_siguientes)):
+        return None
+    return _armar(carga, orden, llegadas, rafagas, por_llegada=False)
+
+
+def _arreglos(carga):
+    """(llegadas, ráfagas) como arreglos enteros, o None si el camino rápido no aplica."""
+    if np is None or len(carga) == 0 or grabacion_actual() is not None:
+        return None
+    llegadas, rafagas = [], []
+    for _, arrival_time, bursts, _ in carga:
+        # Una sola ráfaga de CPU (se admite el cierre con ceros que agrega la GUI: [5, 0])
+        if not bursts or any(bursts[1:]):
+            return None
+        llegadas.append(arrival_time)
+        rafagas.append(bursts[0])
+    llegadas = np.asarray(llegadas)
+    rafagas = np.asarray(rafagas)
+    # Sólo enteros (los flotantes acumulados podrían redondear distinto que el motor)
+    if llegadas.dtype.kind != "i" or rafagas.dtype.kind != "i":
+        return None
+    if np.any(rafagas <= 0):
+        return None
+    return llegadas, rafagas
+
+
+def _plan(llegadas, rafagas):
+    """Inicio y fin de cada ráfaga ejecutada en el orden dado (forma cerrada)."""
+    acumulado = np.cumsum(rafagas)
+    holgura = llegadas - (acumulado - rafagas)
+    holgura[0] = max(holgura[0], 0)
+    fin = acumulado + np.maximum.accumulate(holgura)
+    return fin - rafagas, fin
+
+
+def _armar(carga, orden, llegadas, rafagas, por_llegada):
+    """Construye Gantt y procesos (con métricas) a partir del orden de despacho."""
+    inicio, fin = _plan(llegadas[orden], rafagas[orden])
+    fin_previo = np.concatenate(([0], fin[:-1]))
+    huecos = inicio > fin_previo
+    tr = fin - llegadas[orden]
+    te = tr - rafagas[orden]
+
+    processes = carga.instanciar()
+    for idx, p in enumerate(processes):
+        p._seq = idx
+
+    gantt = Gantt(con_tipo=False)
+    ejecutados = [processes[i] for i in orden.tolist()]
+    for p, ini, f, previo, hueco, tr_i, te_i in zip(
+            ejecutados, inicio.tolist(), fin.tolist(), fin_previo.tolist(),
+            huecos.tolist(), tr.tolist(), te.tolist()):
+        if hueco:
+            gantt.agregar("IDLE", previo, ini, "IDLE")
+        gantt.agregar(p.pid, ini, f)
+        # Mismo estado final que deja el motor en un proceso sin bloqueos
+        p.bursts[0] = 0
+        p.remaining_time = 0
+        p.cpu_restante = 0
+        p.start_time = ini
+        p.completion_time = f
+        p.turnaround_time = tr_i
+        p.waiting_time = te_i
+
+    if por_llegada:
+        return gantt, ejecutados
+    return gantt, processes
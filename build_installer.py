@@ -39,7 +39,6 @@ class BuildInstaller:
             'pyinstaller',
             'customtkinter',
             'matplotlib',
-            'pandas',
             'openpyxl'
         ]
         
@@ -118,7 +117,6 @@ a = Analysis(
     hiddenimports=[
         'customtkinter',
         'matplotlib.backends.backend_tkagg',
-        'pandas',
         'openpyxl',
         'tkinter',
         'tkinter.ttk',
@@ -134,7 +132,7 @@ a = Analysis(
     hookspath=[],
     hooksconfig={{}},
     runtime_hooks=[],
-    excludes=[],
+    excludes=['pandas'],
     noarchive=False,
     optimize=0,
 )
@@ -267,7 +265,6 @@ exe = EXE(
         requirements = [
             "customtkinter>=5.2.0",
             "matplotlib>=3.5.0",
-            "pandas>=1.3.0",
             "openpyxl>=3.0.0",
             "pyinstaller>=5.0.0"
         ]
@@ -1,8 +1,20 @@
+import time
+
+_INICIO = time.perf_counter()
+
+import multiprocessing
+import os
+import sys
+
 import customtkinter as ctk
 from GUI.start_screen import StartScreen
 from GUI.name_input_screen import NameInputScreen
 from GUI.data_input_screen import DataInputScreen
-from GUI.algorithm_screen import AlgorithmScreen
+from utils.parsers import config_a_procesos_data
+
+# Presupuesto de arranque (segundos hasta ver la pantalla inicial). Con
+# TIMESLICE_MEDIR_INICIO=1 se informa el tiempo medido por stderr.
+PRESUPUESTO_INICIO = 1.0
 
 # --- Funciones de navegación entre pantallas ---
 
@@ -29,25 +41,7 @@ def ir_a_nombres(payload):
         # A) Cargar CONFIGURACIÓN guardada (inputs) -> convertir a procesos_data y saltar a AlgorithmScreen
         if action == "load_config" and isinstance(data, dict):
             # data esperado: {"nombre","fecha","procesos":[{"nombre","arrival","priority","bursts"}, ...]}
-            procesos_cfg = data.get("procesos", [])
-            procesos_data = []
-
-            for item in procesos_cfg:
-                nombre = item.get("nombre", "P?")
-                arrival = int(item.get("arrival", 0))
-                priority = int(item.get("priority", 0))
-                bursts = list(item.get("bursts", []))
-
-                # Normalizar: si quedó en BLOQ, cerramos con CPU=0 (pares = CPU, impares = BLOQ)
-                if len(bursts) % 2 == 1:
-                    bursts.append(0)
-
-                procesos_data.append({
-                    "pid": nombre,               # usamos el nombre guardado -> no hay mismatch
-                    "arrival_time": arrival,
-                    "priority": priority,
-                    "bursts": bursts
-                })
+            procesos_data = config_a_procesos_data(data)
 
             # Ir directo a simulación/algoritmos
             ir_a_algoritmo(procesos_data)
@@ -70,6 +64,9 @@ def ir_a_tiempos(nombres):
     data_screen.pack(fill="both", expand=True)
 
 def ir_a_algoritmo(procesos_data):
+    # Pantalla de simulación (matplotlib, exportación) sólo cuando se la necesita
+    from GUI.algorithm_screen import AlgorithmScreen
+
     limpiar_ventana()
     algo_screen = AlgorithmScreen(root, procesos_data, volver_inicio)
     algo_screen.pack(fill="both", expand=True)
@@ -79,6 +76,15 @@ def volver_inicio():
     start_screen = StartScreen(root, ir_a_nombres)
     start_screen.pack(fill="both", expand=True)
 
+def _informar_inicio():
+    """Informa cuánto tardó en aparecer la pantalla inicial (TIMESLICE_MEDIR_INICIO=1)."""
+    if os.environ.get("TIMESLICE_MEDIR_INICIO", "").strip() != "1":
+        return
+    transcurrido = time.perf_counter() - _INICIO
+    estado = "OK" if transcurrido <= PRESUPUESTO_INICIO else "EXCEDIDO"
+    print(f"Inicio: {transcurrido:.3f} s (presupuesto {PRESUPUESTO_INICIO:.1f} s, {estado})",
+          file=sys.stderr)
+
 def limpiar_ventana():
     """Elimina todos los widgets de la ventana principal."""
     for widget in root.winfo_children():
@@ -86,6 +92,9 @@ def limpiar_ventana():
 
 # --- Configuración inicial de la app ---
 if __name__ == "__main__":
+    # Necesario para los procesos trabajadores (comparación en paralelo) en el ejecutable
+    multiprocessing.freeze_support()
+
     ctk.set_appearance_mode("dark")  # Modo oscuro
     ctk.set_default_color_theme("blue")  # Tema azul
 
@@ -96,5 +105,6 @@ if __name__ == "__main__":
     # Pantalla inicial
     start_screen = StartScreen(root, ir_a_nombres)
     start_screen.pack(fill="both", expand=True)
+    root.after_idle(_informar_inicio)
 
     root.mainloop()
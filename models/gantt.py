@@ -0,0 +1,349 @@
+# GanddOperativos/models/gantt.py
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+
+# Códigos de tipo de tramo (columna 'tipo', un byte por tramo)
+CPU = 0
+BLOCK = 1
+IDLE = 2
+TIPOS = ("CPU", "BLOCK", "IDLE")
+_CODIGOS = {"CPU": CPU, "BLOCK": BLOCK, "Bloqueo": BLOCK, "IDLE": IDLE}
+
+
+class Gantt:
+    """
+    Diagrama de Gantt en columnas: índice del pid (los nombres se guardan una sola
+    vez), inicio y fin (enteros de 64 bits) y tipo (un byte). Un tramo ocupa 21 bytes
+    en lugar de una tupla con sus objetos.
+
+    Para compatibilidad se comporta como la lista de tuplas que devolvían los
+    algoritmos: len(), iteración, g[i] y comparación con listas dan (pid, inicio, fin,
+    tipo), o (pid, inicio, fin) si con_tipo es False.
+
+    Las columnas se leen sin copiar (memoryview, o arreglos NumPy con arreglos()), y
+    g[a:b] y entre(t0, t1) devuelven vistas que comparten los datos. Mientras haya
+    vistas vivas no se pueden agregar tramos (BufferError).
+    """
+
+    __slots__ = ("con_tipo", "_pids", "_indice", "_pid", "_inicio", "_fin", "_tipo",
+                 "_ordenado", "_fin_max", "_indice_tramos")
+
+    def __init__(self, con_tipo=True):
+        """
+        :param con_tipo: True = tuplas (pid, inicio, fin, tipo); False = (pid, inicio, fin)
+        """
+        self.con_tipo = con_tipo
+        self._pids = []            # índice -> pid
+        self._indice = {}          # pid -> índice
+        self._pid = array("i")
+        self._inicio = array("q")
+        self._fin = array("q")
+        self._tipo = array("B")
+        self._ordenado = True      # inicios no decrecientes (lo que produce el motor)
+        self._fin_max = None       # máximo acumulado de los fines (ver entre)
+        self._indice_tramos = None # IndiceTramos (ver indice_tramos)
+
+    # ---------- Construcción ----------
+    @classmethod
+    def desde_tuplas(cls, tramos, con_tipo=None):
+        """
+        Crea el Gantt a partir de tuplas (pid, start, end) o (pid, start, end, tipo);
+        ignora otros formatos. con_tipo=None = según la forma del primer tramo.
+        """
+        gantt = None
+        for tramo in tramos:
+            if len(tramo) == 3:
+                pid, inicio, fin = tramo
+                tipo = "IDLE" if pid == "IDLE" else "CPU"
+            elif len(tramo) == 4:
+                pid, inicio, fin, tipo = tramo
+                if pid == "IDLE":
+                    tipo = "IDLE"
+            else:
+                continue
+            if gantt is None:
+                gantt = cls(len(tramo) == 4 if con_tipo is None else con_tipo)
+            gantt.agregar(pid, inicio, fin, tipo)
+        return gantt if gantt is not None else cls(True if con_tipo is None else con_tipo)
+
+    @classmethod
+    def de(cls, gantt):
+        """Devuelve 'gantt' si ya es un Gantt; si no, lo interpreta como lista de tuplas."""
+        if isinstance(gantt, cls):
+            return gantt
+        return cls.desde_tuplas(gantt)
+
+    @classmethod
+    def desde_columnas(cls, columnas):
+        """Inverso de a_columnas()."""
+        gantt = cls(columnas["con_tipo"])
+        for pid in columnas["pids"]:
+            gantt._internar(pid)
+        tipo_tiempo = "q" if all(isinstance(t, int) for t in columnas["inicio"] + columnas["fin"]) else "d"
+        gantt._pid = array("i", columnas["pid"])
+        gantt._inicio = array(tipo_tiempo, columnas["inicio"])
+        gantt._fin = array(tipo_tiempo, columnas["fin"])
+        gantt._tipo = array("B", columnas["tipo"])
+        inicio = gantt._inicio
+        gantt._ordenado = all(inicio[i] <= inicio[i + 1] for i in range(len(inicio) - 1))
+        gantt._indice_tramos = None
+        return gantt
+
+    def agregar(self, pid, inicio, fin, tipo="CPU"):
+        """Agrega el tramo (pid, inicio, fin, tipo) al final."""
+        codigo = _CODIGOS[tipo]
+        n = len(self._pid)
+        try:
+            self._inicio.append(inicio)
+            self._fin.append(fin)
+        except TypeError:
+            # Tiempos no enteros: las columnas de tiempo pasan a punto flotante
+            self._inicio = array("d", self._inicio[:n])
+            self._fin = array("d", self._fin[:n])
+            self._inicio.append(inicio)
+            self._fin.append(fin)
+        self._pid.append(self._internar(pid))
+        self._tipo.append(codigo)
+        if n and inicio < self._inicio[n - 1]:
+            self._ordenado = False
+        self._fin_max = None
+        self._indice_tramos = None
+
+    def extender(self, i, fin):
+        """Mueve el fin del tramo i (para unir tramos consecutivos del mismo pid)."""
+        self._fin[i] = fin
+        self._fin_max = None
+        self._indice_tramos = None
+
+    def _internar(self, pid):
+        idx = self._indice.get(pid)
+        if idx is None:
+            idx = self._indice[pid] = len(self._pids)
+            self._pids.append(pid)
+        return idx
+
+    # ---------- Columnas ----------
+    @property
+    def pids(self):
+        """Nombres de los pids, en el orden de sus índices (columna pid_idx)."""
+        return tuple(self._pids)
+
+    @property
+    def pid_idx(self):
+        return memoryview(self._pid).toreadonly()
+
+    @property
+    def inicio(self):
+        return memoryview(self._inicio).toreadonly()
+
+    @property
+    def fin(self):
+        return memoryview(self._fin).toreadonly()
+
+    @property
+    def tipo(self):
+        """Códigos CPU / BLOCK / IDLE (ver TIPOS)."""
+        return memoryview(self._tipo).toreadonly()
+
+    def arreglos(self):
+        """Columnas como arreglos NumPy de sólo lectura, sin copia: (pid_idx, inicio, fin, tipo)."""
+        import numpy as np
+        return tuple(np.asarray(col) for col in (self.pid_idx, self.inicio, self.fin, self.tipo))
+
+    def a_columnas(self):
+        """Dict serializable a JSON (ver desde_columnas)."""
+        return {"con_tipo": self.con_tipo, "pids": list(self._pids),
+                "pid": self._pid.tolist(), "inicio": self._inicio.tolist(),
+                "fin": self._fin.tolist(), "tipo": self._tipo.tolist()}
+
+    @property
+    def nbytes(self):
+        """Bytes ocupados por las columnas (sin los nombres de los pids)."""
+        return sum(col.itemsize * len(col) for col in (self._pid, self._inicio, self._fin, self._tipo))
+
+    # ---------- Consultas ----------
+    def num_procesos(self):
+        """Cantidad de pids distintos (sin contar IDLE)."""
+        presentes = set(self._pid)
+        return sum(1 for i in presentes if self._pids[i] != "IDLE")
+
+    def duracion(self):
+        """Fin del último tramo (0 si está vacío)."""
+        return max(self._fin) if len(self._fin) else 0
+
+    def entre(self, t0, t1):
+        """
+        Vista (sin copia) con los tramos que pueden cortar [t0, t1), en orden de inicio.
+
+        Es un rango contiguo, así que puede incluir algunos tramos que terminan antes
+        de t0 (los que quedan después de un bloqueo largo que sí llega a t0); quien
+        necesite el corte exacto filtra por fin > t0. Cuesta O(log n) después de la
+        primera llamada.
+        """
+        base = self.ordenado()
+        if base._fin_max is None:
+            base._fin_max = array(memoryview(base._fin).format, accumulate(base._fin, max))
+        desde = bisect_right(base._fin_max, t0)
+        hasta = bisect_left(base._inicio, t1)
+        return base[desde:max(desde, hasta)]
+
+    def indice_tramos(self):
+        """IndiceTramos de este Gantt (se arma en la primera llamada y se reutiliza)."""
+        if self._indice_tramos is None:
+            self._indice_tramos = IndiceTramos(self)
+        return self._indice_tramos
+
+    def ordenado(self):
+        """El mismo Gantt si los inicios no decrecen; si no, una copia ordenada por inicio."""
+        if self._ordenado:
+            return self
+        orden = sorted(range(len(self)), key=self._inicio.__getitem__)
+        copia = Gantt(self.con_tipo)
+        for i in orden:
+            copia.agregar(self._pids[self._pid[i]], self._inicio[i], self._fin[i], TIPOS[self._tipo[i]])
+        return copia
+
+    # ---------- Interfaz de lista de tuplas ----------
+    def _tupla(self, i):
+        pid = self._pids[self._pid[i]]
+        if self.con_tipo:
+            return (pid, self._inicio[i], self._fin[i], TIPOS[self._tipo[i]])
+        return (pid, self._inicio[i], self._fin[i])
+
+    def __len__(self):
+        return len(self._pid)
+
+    def __iter__(self):
+        if self.con_tipo:
+            return self.tramos()
+        pids = self._pids
+        return ((pids[p], i, f) for p, i, f in zip(self._pid, self._inicio, self._fin))
+
+    def tramos(self):
+        """Itera (pid, inicio, fin, tipo) aunque con_tipo sea False."""
+        pids = self._pids
+        for p, i, f, t in zip(self._pid, self._inicio, self._fin, self._tipo):
+            yield (pids[p], i, f, TIPOS[t])
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            vista = Gantt.__new__(Gantt)
+            vista.con_tipo = self.con_tipo
+            vista._pids = self._pids
+            vista._indice = self._indice
+            vista._pid, vista._inicio, vista._fin, vista._tipo = (
+                memoryview(col).toreadonly()[i] for col in (self._pid, self._inicio, self._fin, self._tipo))
+            vista._ordenado = self._ordenado and (i.step is None or i.step > 0)
+            vista._fin_max = None
+            vista._indice_tramos = None
+            return vista
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("índice de tramo fuera de rango")
+        return self._tupla(i)
+
+    def __eq__(self, otro):
+        if isinstance(otro, (Gantt, list, tuple)):
+            return len(self) == len(otro) and all(a == tuple(b) for a, b in zip(self, otro))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self):
+        # Las vistas (memoryview) no se serializan: se envían las columnas
+        return (Gantt.desde_columnas, (self.a_columnas(),))
+
+    def __repr__(self):
+        return f"Gantt({len(self)} tramos, {len(self._pids)} pids)"
+
+
+class IndiceTramos:
+    """
+    Índice de intervalos sobre los tramos de un Gantt, para preguntar qué pasaba en un
+    instante o en un rango sin recorrer todo el diagrama:
+
+        indice = gantt.indice_tramos()
+        indice.en(12)              # tramos que cubren t = 12
+        indice.ejecutando(12)      # pid en CPU en t = 12 (o None)
+        indice.bloqueados(12)      # pids bloqueados en t = 12
+        indice.entre(10, 20)       # tramos que cortan [10, 20)
+
+    Los tramos se toman ordenados por inicio: los candidatos son los que empiezan antes
+    del fin de la consulta (búsqueda binaria) y, entre ellos, un árbol de máximos de
+    los fines (arreglo con forma de heap) lleva directo a los que terminan después del
+    comienzo. Una consulta cuesta O((k + 1) log n) para k tramos encontrados; armar el
+    índice, O(n).
+
+    Un tramo [inicio, fin) cubre t si inicio <= t < fin.
+    """
+
+    __slots__ = ("gantt", "_hojas", "_maximo")
+
+    def __init__(self, gantt):
+        self.gantt = gantt.ordenado()
+        fin = self.gantt._fin
+        hojas = 1
+        while hojas < len(fin):
+            hojas *= 2
+        # _maximo[1] es la raíz, los hijos de k son 2k y 2k + 1 y las hojas empiezan
+        # en 'hojas'; las hojas de relleno nunca se visitan (quedan fuera del rango)
+        maximo = array(memoryview(fin).format, [0]) * (2 * hojas)
+        maximo[hojas:hojas + len(fin)] = array(maximo.typecode, fin)
+        for k in range(hojas - 1, 0, -1):
+            izq, der = maximo[2 * k], maximo[2 * k + 1]
+            maximo[k] = izq if izq > der else der
+        self._hojas = hojas
+        self._maximo = maximo
+
+    def __len__(self):
+        return len(self.gantt)
+
+    def _posiciones(self, hasta, desde_t):
+        """Posiciones i < hasta (en el Gantt ordenado) con fin[i] > desde_t, en orden."""
+        maximo, hojas = self._maximo, self._hojas
+        posiciones = []
+        pila = [(1, 0, hojas)]
+        while pila:
+            nodo, lo, hi = pila.pop()
+            if lo >= hasta or maximo[nodo] <= desde_t:
+                continue
+            if nodo >= hojas:
+                posiciones.append(lo)
+                continue
+            medio = (lo + hi) // 2
+            pila.append((2 * nodo + 1, medio, hi))
+            pila.append((2 * nodo, lo, medio))
+        return posiciones
+
+    def _tramos(self, posiciones):
+        gantt = self.gantt
+        pids, pid, inicio, fin, tipo = gantt._pids, gantt._pid, gantt._inicio, gantt._fin, gantt._tipo
+        return [(pids[pid[i]], inicio[i], fin[i], TIPOS[tipo[i]]) for i in posiciones]
+
+    def en(self, t):
+        """Tramos (pid, inicio, fin, tipo) que cubren el instante t, en orden de inicio."""
+        return self._tramos(self._posiciones(bisect_right(self.gantt._inicio, t), t))
+
+    def entre(self, t0, t1):
+        """Tramos (pid, inicio, fin, tipo) que cortan [t0, t1), en orden de inicio."""
+        return self._tramos(self._posiciones(bisect_left(self.gantt._inicio, t1), t0))
+
+    def ejecutando(self, t):
+        """Pid en CPU en el instante t, o None (CPU libre)."""
+        for pid, _, _, tipo in self.en(t):
+            if tipo == "CPU" and pid != "IDLE":
+                return pid
+        return None
+
+    def bloqueados(self, t):
+        """Pids bloqueados (E/S) en el instante t."""
+        return [pid for pid, _, _, tipo in self.en(t) if tipo == "BLOCK"]
+
+    def tramo_de(self, pid, t):
+        """Tramo de 'pid' que cubre t (su CPU, su bloqueo o el IDLE), o None."""
+        for tramo in self.en(t):
+            if tramo[0] == pid:
+                return tramo
+        return None
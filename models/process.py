@@ -1,5 +1,14 @@
 # GanddOperativos/models/process.py
 class Process:
+    # Atributos fijos: sin __dict__ por instancia (menos memoria y acceso más rápido
+    # con muchos procesos). Todo estado que usen los algoritmos debe declararse acá.
+    __slots__ = (
+        "pid", "arrival_time", "bursts", "bursts_original", "current_burst_index",
+        "remaining_time", "priority", "cpu_restante", "cpu_total", "es_total",
+        "start_time", "completion_time", "turnaround_time", "waiting_time",
+        "ready_since", "_seq",
+    )
+
     def __init__(self, pid, arrival_time, bursts, priority=0):
         """
         Representa un proceso con ráfagas de CPU y bloqueos (E/S).
@@ -12,11 +21,18 @@ class Process:
         """
         self.pid = pid
         self.arrival_time = arrival_time
-        self.bursts = bursts[:]              # copia viva (puede mutar en algoritmos)
-        self.bursts_original = bursts[:]     # copia inmutable para métricas
+        self.bursts = list(bursts)           # copia viva (puede mutar en algoritmos)
+        self.bursts_original = tuple(bursts) # inmutable para métricas (si ya es tupla se comparte, no se copia)
         self.current_burst_index = 0
         self.remaining_time = bursts[0] if bursts else 0
         self.priority = priority             # Prioridad del proceso (mayor número = mayor prioridad)
+        # CPU total restante (ráfagas de CPU vivas desde la posición actual, negativas = 0).
+        # Se mantiene al descontar CPU y al avanzar de ráfaga: leerlo es O(1).
+        cpu = bursts[0::2]
+        self.cpu_restante = sum(cpu) if not cpu or min(cpu) >= 0 else sum(b for b in cpu if b > 0)
+        # Totales de las ráfagas originales (CPU = pares, E/S = impares): fijos, para métricas
+        self.cpu_total = sum(cpu)
+        self.es_total = sum(bursts[1::2])
 
         # Métricas
         self.start_time = None
@@ -26,6 +42,7 @@ class Process:
 
         # Estado de planificación
         self.ready_since = None      # cuándo quedó en ready por última vez
+        self._seq = 0                # orden de definición (lo asigna el motor en cada corrida)
 
     # ---------- Utilidades de estado ----------
     def is_cpu_burst(self):
@@ -38,12 +55,23 @@ class Process:
 
     def advance_burst(self):
         """Avanza a la siguiente ráfaga."""
+        if self.current_burst_index % 2 == 0 and self.current_burst_index < len(self.bursts):
+            # Lo que quede de la ráfaga de CPU que se abandona deja de contar
+            self.cpu_restante -= max(self.bursts[self.current_burst_index], 0)
         self.current_burst_index += 1
         if self.current_burst_index < len(self.bursts):
             self.remaining_time = self.bursts[self.current_burst_index]
         else:
             self.remaining_time = 0
 
+    def consume_cpu(self, tiempo):
+        """Descuenta 'tiempo' unidades ejecutadas de la ráfaga de CPU actual (copia viva)."""
+        idx = self.current_burst_index
+        antes = self.bursts[idx]
+        self.bursts[idx] = antes - tiempo
+        self.remaining_time -= tiempo
+        self.cpu_restante += max(antes - tiempo, 0) - max(antes, 0)
+
     def get_remaining_bursts(self):
         """Retorna las ráfagas restantes del proceso (desde el índice actual)."""
         return self.bursts[self.current_burst_index:] if self.current_burst_index < len(self.bursts) else []
@@ -63,19 +91,11 @@ class Process:
         """
         Retorna el total de CPU restante desde la posición actual.
         Si está en bloqueo (índice impar), comienza desde la próxima CPU.
-        Considera la lista 'bursts' viva (por si un algoritmo preemptivo descuenta).
+        Considera la lista 'bursts' viva (por si un algoritmo preemptivo descuenta):
+        los descuentos deben hacerse con consume_cpu() / advance_burst() para que
+        el contador 'cpu_restante' quede al día.
         """
-        idx = self.current_burst_index
-        if idx >= len(self.bursts):
-            return 0
-        start = idx if idx % 2 == 0 else idx + 1
-        total = 0
-        for i in range(start, len(self.bursts), 2):  # sólo índices de CPU
-            dur = self.bursts[i]
-            if dur < 0:
-                dur = 0
-            total += dur
-        return total
+        return self.cpu_restante
 
     # ---------- Métricas (siempre contra los datos originales) ----------
     def calculate_metrics(self):
@@ -83,35 +103,26 @@ class Process:
         Calcula TR (turnaround time) y TE (waiting time).
         TR = completion_time - arrival_time
         TE = TR - tiempo total de CPU - tiempo total de bloqueos
-        Se usa 'bursts_original' para evitar sesgos si un algoritmo mutó 'bursts'.
+        Los totales salen de las ráfagas originales (cpu_total / es_total), así que no
+        hay sesgos si un algoritmo mutó 'bursts'.
         """
         if self.completion_time is None:
             raise ValueError(f"No se puede calcular métricas: {self.pid} no tiene completion_time asignado.")
 
-        source = self.bursts_original if hasattr(self, "bursts_original") and self.bursts_original else self.bursts
-
         # Tiempo total en el sistema
         self.turnaround_time = self.completion_time - self.arrival_time
 
-        # Suma de todas las ráfagas de CPU (índices pares)
-        total_cpu = sum(source[i] for i in range(0, len(source), 2))
-
-        # Suma de todas las ráfagas de bloqueo/E/S (índices impares)
-        total_bloq = sum(source[i] for i in range(1, len(source), 2))
-
-        # Tiempo de espera real en cola de listos
-        self.waiting_time = self.turnaround_time - total_cpu - total_bloq
+        # Tiempo de espera real en cola de listos (totales de CPU y bloqueos ya sumados al crear)
+        self.waiting_time = self.turnaround_time - self.cpu_total - self.es_total
 
     # ---------- Agregados informativos ----------
     def get_total_cpu_time(self):
-        """Retorna el tiempo total de CPU del proceso (sobre datos originales si están disponibles)."""
-        source = self.bursts_original if hasattr(self, "bursts_original") and self.bursts_original else self.bursts
-        return sum(source[i] for i in range(0, len(source), 2))
+        """Retorna el tiempo total de CPU del proceso (sobre las ráfagas originales)."""
+        return self.cpu_total
 
     def get_total_blocking_time(self):
-        """Retorna el tiempo total de bloqueo del proceso (sobre datos originales si están disponibles)."""
-        source = self.bursts_original if hasattr(self, "bursts_original") and self.bursts_original else self.bursts
-        return sum(source[i] for i in range(1, len(source), 2))
+        """Retorna el tiempo total de bloqueo del proceso (sobre las ráfagas originales)."""
+        return self.es_total
 
     def get_burst_count(self):
         """Retorna el número total de ráfagas (CPU + bloqueos)."""
@@ -125,6 +136,15 @@ class Process:
         """Retorna el número de ráfagas de bloqueo."""
         return len([i for i in range(1, len(self.bursts), 2)])
 
+    # ---------- Serialización (pickle entre procesos, p. ej. comparaciones en paralelo) ----------
+    def __getstate__(self):
+        """Estado como tupla en el orden de __slots__ (más compacto que un dict por proceso)."""
+        return tuple(getattr(self, attr) for attr in Process.__slots__)
+
+    def __setstate__(self, estado):
+        for attr, valor in zip(Process.__slots__, estado):
+            setattr(self, attr, valor)
+
     def __repr__(self):
         return (f"Process(pid={self.pid}, arrival={self.arrival_time}, bursts={self.bursts}, "
                 f"priority={self.priority}, idx={self.current_burst_index}, start={self.start_time}, "
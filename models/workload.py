@@ -0,0 +1,66 @@
+# GanddOperativos/models/workload.py
+from .process import Process
+
+
+class Workload:
+    """
+    Carga de trabajo inmutable: los datos de entrada de un ejercicio (pid, llegada,
+    ráfagas y prioridad), compartidos entre todas las corridas que se hagan sobre él.
+
+    Cada corrida pide su propio estado mutable con instanciar(): procesos nuevos que
+    sólo copian lo que el algoritmo modifica (la lista viva de ráfagas) y comparten
+    con la carga la tupla original de ráfagas que se usa para métricas. Así comparar
+    varios algoritmos o barrer quantums no vuelve a copiar toda la entrada.
+    """
+
+    __slots__ = ("_procesos",)
+
+    def __init__(self, procesos):
+        """
+        :param procesos: iterable de tuplas (pid, arrival_time, bursts, priority)
+        """
+        self._procesos = tuple(
+            (pid, arrival_time, tuple(bursts), priority)
+            for pid, arrival_time, bursts, priority in procesos
+        )
+
+    # ---------- Construcción ----------
+    @classmethod
+    def desde_procesos(cls, process_list):
+        """Crea la carga a partir de objetos Process (toma su estado de ráfagas actual)."""
+        return cls((p.pid, p.arrival_time, p.bursts, p.priority) for p in process_list)
+
+    @classmethod
+    def desde_dicts(cls, procesos_data):
+        """Crea la carga a partir de procesos_data de la GUI ({pid, arrival_time, bursts, priority})."""
+        return cls(
+            (p["pid"], p["arrival_time"], p["bursts"], p.get("priority", 0))
+            for p in procesos_data
+        )
+
+    @classmethod
+    def de(cls, carga):
+        """Devuelve 'carga' si ya es un Workload; si no, la interpreta como lista de Process."""
+        if isinstance(carga, cls):
+            return carga
+        return cls.desde_procesos(carga)
+
+    # ---------- Estado por corrida ----------
+    def instanciar(self):
+        """Crea los procesos mutables de una corrida (nuevos en cada llamada)."""
+        return [Process(pid, arrival_time, bursts, priority)
+                for pid, arrival_time, bursts, priority in self._procesos]
+
+    # ---------- Consultas ----------
+    def tiene_bloqueos(self):
+        """True si algún proceso tiene más de una ráfaga (CPU y E/S)."""
+        return any(len(bursts) > 1 for _, _, bursts, _ in self._procesos)
+
+    def __len__(self):
+        return len(self._procesos)
+
+    def __iter__(self):
+        return iter(self._procesos)
+
+    def __repr__(self):
+        return f"Workload({len(self._procesos)} procesos)"
@@ -0,0 +1,196 @@
+# utils/cache.py
+"""
+Caché de resultados de simulación.
+
+La clave es un hash (sha256) de la carga normalizada, el algoritmo, el quantum y
+VERSION_MOTOR; el valor es el Gantt y las métricas (también las extendidas) ya calculadas. Delante del disco
+hay un LRU en memoria; en disco cada resultado es un JSON en data_path("cache") y,
+si el total supera el límite, se borran primero los menos usados.
+
+Los errores de disco (carpeta no escribible, archivo corrupto) nunca cortan la
+simulación: se tratan como un fallo de caché.
+"""
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+from algoritmos import registro
+from algoritmos.registro import VERSION_MOTOR
+from models.gantt import Gantt
+from models.workload import Workload
+
+from .metricas import TablaMetricas, calcular_metricas, metricas_extendidas
+from .paths import data_path
+
+MAX_MEMORIA = 32                    # resultados en el LRU en memoria
+MAX_BYTES_DISCO = 64 * 1024 * 1024  # tope del directorio de caché en disco
+
+
+def clave_simulacion(carga, algoritmo, quantum=None):
+    """Huella (hex) de una corrida: misma carga, algoritmo, quantum y versión -> misma clave."""
+    carga = Workload.de(carga)
+    if not registro.requiere_quantum(algoritmo):
+        quantum = None
+    contenido = json.dumps(
+        [VERSION_MOTOR, algoritmo, quantum, list(carga)],
+        separators=(",", ":"), ensure_ascii=False,
+    )
+    return hashlib.sha256(contenido.encode("utf-8")).hexdigest()
+
+
+class CacheResultados:
+    """LRU en memoria + directorio en disco con tamaño acotado."""
+
+    def __init__(self, directorio=None, max_memoria=MAX_MEMORIA, max_bytes=MAX_BYTES_DISCO):
+        self.directorio = directorio
+        self.max_memoria = max_memoria
+        self.max_bytes = max_bytes
+        self._memoria = OrderedDict()
+
+    # ---------- API ----------
+    def obtener(self, clave):
+        """Resultado guardado para 'clave' o None."""
+        if clave in self._memoria:
+            self._memoria.move_to_end(clave)
+            return self._memoria[clave]
+
+        valor = self._leer_disco(clave)
+        if valor is not None:
+            self._recordar(clave, valor)
+        return valor
+
+    def guardar(self, clave, valor):
+        """Guarda 'valor' (serializable a JSON) en memoria y en disco."""
+        self._recordar(clave, valor)
+        self._escribir_disco(clave, valor)
+
+    def limpiar(self):
+        """Vacía la memoria y borra los archivos de caché."""
+        self._memoria.clear()
+        for ruta, _, _ in self._archivos():
+            try:
+                os.remove(ruta)
+            except OSError:
+                pass
+
+    # ---------- Memoria ----------
+    def _recordar(self, clave, valor):
+        self._memoria[clave] = valor
+        self._memoria.move_to_end(clave)
+        while len(self._memoria) > self.max_memoria:
+            self._memoria.popitem(last=False)
+
+    # ---------- Disco ----------
+    def _ruta(self, clave):
+        return os.path.join(self.directorio, clave + ".json")
+
+    def _leer_disco(self, clave):
+        if self.directorio is None:
+            return None
+        ruta = self._ruta(clave)
+        try:
+            with open(ruta, "r", encoding="utf-8") as f:
+                valor = json.load(f)
+            os.utime(ruta)  # marca de uso para el desalojo
+            return valor
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            # Archivo corrupto o ilegible: se descarta
+            try:
+                os.remove(ruta)
+            except OSError:
+                pass
+            return None
+
+    def _escribir_disco(self, clave, valor):
+        if self.directorio is None:
+            return
+        try:
+            datos = json.dumps(valor, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+            if len(datos) > self.max_bytes:
+                return
+            os.makedirs(self.directorio, exist_ok=True)
+            ruta = self._ruta(clave)
+            tmp = ruta + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(datos)
+            os.replace(tmp, ruta)
+            self._desalojar()
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def _archivos(self):
+        """[(ruta, tamaño, último uso)] de los resultados en disco."""
+        if self.directorio is None or not os.path.isdir(self.directorio):
+            return []
+        archivos = []
+        for nombre in os.listdir(self.directorio):
+            if not nombre.endswith(".json"):
+                continue
+            ruta = os.path.join(self.directorio, nombre)
+            try:
+                st = os.stat(ruta)
+            except OSError:
+                continue
+            archivos.append((ruta, st.st_size, st.st_mtime))
+        return archivos
+
+    def _desalojar(self):
+        archivos = self._archivos()
+        total = sum(tam for _, tam, _ in archivos)
+        if total <= self.max_bytes:
+            return
+        for ruta, tam, _ in sorted(archivos, key=lambda a: a[2]):
+            try:
+                os.remove(ruta)
+            except OSError:
+                continue
+            total -= tam
+            if total <= self.max_bytes:
+                break
+
+
+_cache = None
+
+
+def cache_resultados():
+    """Caché compartida de la aplicación (en data_path('cache'))."""
+    global _cache
+    if _cache is None:
+        _cache = CacheResultados(data_path("cache"))
+    return _cache
+
+
+def simular_cacheado(algoritmo, carga, quantum=None, cache=None, extendidas=False):
+    """
+    Igual que registro.ejecutar + calcular_metricas, pero reutiliza resultados previos.
+
+    :param extendidas: devolver también metricas_extendidas() de la corrida
+    :return: (gantt, metricas, trm, tem), más el dict de métricas extendidas si
+             extendidas=True; el Gantt como models.gantt.Gantt y las métricas como
+             utils.metricas.TablaMetricas
+    """
+    cache = cache or cache_resultados()
+    carga = Workload.de(carga)
+    clave = clave_simulacion(carga, algoritmo, quantum)
+
+    valor = cache.obtener(clave)
+    # Las entradas anteriores a las métricas extendidas se vuelven a simular
+    if valor is None or "extendidas" not in valor:
+        gantt, procesos = registro.ejecutar(algoritmo, carga, quantum)
+        metricas, trm, tem = calcular_metricas(procesos)
+        valor = {"gantt": gantt.a_columnas(), "metricas": metricas.a_columnas(),
+                 "trm": trm, "tem": tem, "extendidas": metricas_extendidas(gantt, procesos)}
+        cache.guardar(clave, valor)
+
+    # Copias: quien llama puede modificar sus listas sin tocar la caché
+    gantt = valor["gantt"]
+    gantt = Gantt.desde_columnas(gantt) if isinstance(gantt, dict) else Gantt.desde_tuplas(gantt)
+    metricas = valor["metricas"]
+    metricas = (TablaMetricas.desde_columnas(metricas) if isinstance(metricas, dict)
+                else TablaMetricas.desde_filas(metricas))
+    if extendidas:
+        return gantt, metricas, valor["trm"], valor["tem"], dict(valor["extendidas"])
+    return gantt, metricas, valor["trm"], valor["tem"]
@@ -1,64 +1,461 @@
 # utils/gantt.py
+"""
+Dibujo del diagrama de Gantt, compartido por la pantalla de simulación, la ventana
+separada, la exportación a Excel y plot_gantt.
 
+Cada tipo de tramo (CPU, BLOCK, IDLE) se dibuja con UNA PolyCollection (colores por
+tramo), en lugar de una barra y un texto por tramo. El contenido de cada colección
+depende de la vista (VistaGantt), y se rearma cuando cambian los límites del eje X:
+
+- sólo entran los tramos que cortan el rango visible (búsqueda binaria por inicio);
+- los tramos de menos de un píxel se juntan por fila y columna de píxeles, y las
+  columnas ocupadas contiguas de una fila forman una sola barra (en una fila y capa
+  todos los tramos tienen el mismo color, así que el dibujo no cambia);
+- los tramos angostos van en una colección aparte sin borde ni rayado (a ese ancho
+  no se ven, y el rayado es lo más caro de dibujar), y el rayado de los bloqueos se
+  omite si hay demasiados a la vista;
+- sólo se escriben las etiquetas que entran en el ancho de su barra;
+- al arrastrar se redibujan sólo los tramos sobre un fondo guardado (blitting);
+- la línea de tiempo de la reproducción paso a paso y el tooltip del tramo bajo el
+  mouse (buscado en el índice de intervalos del Gantt, Gantt.indice_tramos) también
+  se dibujan con blitting, sobre el dibujo completo guardado después de cada redibujo.
+
+El eje X usa un localizador entero que se adapta a la vista (con zoom se llega a un
+tick por unidad) y el tamaño de la figura tiene tope: ni los ticks ni el lienzo
+crecen con la duración de la corrida.
+"""
+import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba
+from matplotlib.ticker import MaxNLocator
 
-def plot_gantt(gantt_chart, title="Diagrama de Gantt"):
+from models.gantt import Gantt, CPU, BLOCK, IDLE
+
+ALTO_BARRA = 0.6
+TAM_FUENTE_ETIQUETA = 7
+# Tope de etiquetas por vista (aunque entren, miles de textos hacen lento el dibujo)
+MAX_ETIQUETAS = 500
+# Tramos más angostos que esto (en píxeles) se agregan por columna de píxeles
+MIN_PIXELES_TRAMO = 1.0
+# Tramos más angostos que esto (en píxeles) se dibujan sin borde ni rayado
+MIN_PIXELES_DETALLE = 4.0
+# Con más bloqueos a la vista se dibujan sin rayado
+MAX_RAYADOS = 5000
+
+# Tope del tamaño de figura (pulgadas); más allá se recorre con zoom y arrastre
+MAX_ANCHO_FIGURA = 20
+MAX_ALTO_FIGURA = 12
+
+# Estilo fijo de los tramos que no son CPU: (color, rayado, alpha)
+_ESTILO_BLOCK = ("darkred", "///", 0.8)
+_ESTILO_IDLE = ("lightgray", None, 0.7)
+
+_NOMBRES_TIPO = {"CPU": "CPU", "BLOCK": "Bloqueo (E/S)", "IDLE": "IDLE"}
+
+def normalizar_gantt(gantt_chart):
     """
-    Genera un diagrama de Gantt con cada proceso en su propia fila.
+    Tramos como (pid, inicio, fin, tipo) con tipo "CPU", "BLOCK" o "IDLE".
+    Acepta un Gantt o tuplas (pid, start, end) / (pid, start, end, tipo); ignora otros formatos.
+    """
+    return list(Gantt.de(gantt_chart).tramos())
 
-    :param gantt_chart: lista de tuplas (pid, start, end)
-                        Ej: [("P1", 0, 5), ("P2", 5, 8), ("IDLE", 8, 10)]
-    :param title: título del gráfico
+
+def tamano_figura(max_time, num_procesos, alto_minimo=4,
+                  max_ancho=MAX_ANCHO_FIGURA, max_alto=MAX_ALTO_FIGURA):
+    """(ancho, alto) en pulgadas: crece con la duración y los procesos hasta el tope."""
+    ancho = min(max(15, max_time * 0.25), max_ancho)
+    alto = min(max(alto_minimo, num_procesos * 0.8), max_alto)
+    return ancho, alto
+
+
+def dibujar_gantt(ax, gantt_chart, titulo="Diagrama de Gantt", leyenda=True, etiquetas=True):
+    """
+    Dibuja el Gantt en 'ax': una fila por proceso (en orden de aparición) y los IDLE
+    en la fila -1.
+
+    :param leyenda: agregar la leyenda CPU / Bloqueo / IDLE
+    :param etiquetas: escribir el PID en los tramos donde entra
+    :return: la VistaGantt del dibujo ({pid: fila} en .y_positions)
     """
-    # Obtener lista única de procesos (excluyendo IDLE)
-    procesos_unicos = [pid for pid, _, _ in gantt_chart if pid != "IDLE"]
-    procesos_unicos = list(dict.fromkeys(procesos_unicos))  # Mantener orden
+    return VistaGantt(ax, gantt_chart, titulo, leyenda, etiquetas)
 
-    # Asignar un índice Y a cada proceso
-    y_positions = {pid: i for i, pid in enumerate(procesos_unicos)}
 
-    # Colores
-    colors = {}
-    color_palette = plt.cm.get_cmap("tab20", len(procesos_unicos) + 1)
+class _Capa:
+    """Tramos de un tipo en arreglos, ordenados por inicio."""
 
-    fig, ax = plt.subplots(figsize=(10, len(procesos_unicos) * 0.8))
+    def __init__(self, inicio, fin, fila, color, pid_idx, nombres):
+        orden = np.argsort(inicio, kind="stable")
+        self.inicio = inicio.astype(float)[orden]
+        self.fin = fin.astype(float)[orden]
+        self.fila = fila.astype(float)[orden]
+        self.color = color[orden]
+        self.pid_idx = pid_idx[orden]
+        self.nombres = nombres
+        # Máximo acumulado de los fines (no decreciente): permite saltear por búsqueda
+        # binaria los tramos que terminan antes de la vista
+        self.fin_max = np.maximum.accumulate(self.fin)
 
-    for i, (pid, start, end) in enumerate(gantt_chart):
-        if pid not in colors:
-            if pid == "IDLE":
-                colors[pid] = "lightgray"
-            else:
-                colors[pid] = color_palette(len(colors))
+    def visibles(self, x0, x1):
+        """Índices de los tramos que cortan (x0, x1)."""
+        desde = int(np.searchsorted(self.fin_max, x0, side="right"))
+        hasta = int(np.searchsorted(self.inicio, x1, side="left"))
+        if hasta <= desde:
+            return np.empty(0, dtype=np.intp)
+        idx = np.arange(desde, hasta)
+        return idx[self.fin[desde:hasta] > x0]
+
+
+class VistaGantt:
+    """
+    Gantt que se rearma según la vista del eje (ver el docstring del módulo).
+
+    Para arrastrar con blitting: iniciar_arrastre() al apretar, cambiar los límites y
+    llamar a arrastrar() en cada movimiento, terminar_arrastre() al soltar.
+    marcar_tiempo(t) mueve la línea vertical de la reproducción y, con conectar(), el
+    tooltip sigue al mouse; ambos se dibujan sin redibujar los tramos.
+    """
+
+    def __init__(self, ax, gantt_chart, titulo="Diagrama de Gantt", leyenda=True, etiquetas=True):
+        self.ax = ax
+        self.etiquetas = etiquetas
+        self._textos = []
+        self._fondo = None
+        self._arrastrando = False
+        self._cursor = None          # línea de tiempo (reproducción)
+        self._tooltip = None
+        self._tramo_tooltip = None
+        self._fondo_animados = None
+
+        gantt = self.gantt = Gantt.de(gantt_chart)
+        pid_idx, inicio, fin, tipo = gantt.arreglos()
+        nombres = gantt.pids
+
+        # Filas en orden de aparición: los índices de pid ya siguen ese orden
+        procesos = [i for i in np.unique(pid_idx).tolist() if nombres[i] != "IDLE"]
+        self.y_positions = {nombres[i]: y for y, i in enumerate(procesos)}
+        fila_de = np.full(len(nombres), -1.0)
+        fila_de[procesos] = np.arange(len(procesos))
+        self._pid_de_fila = {y: pid for pid, y in self.y_positions.items()}
+        self._pid_de_fila[-1] = "IDLE"
+
+        # Colores por proceso, en orden de primera ráfaga de CPU
+        color_palette = plt.get_cmap("tab20", len(procesos) + 1)
+        color_de = np.zeros((len(nombres), 4))
+        es_cpu = tipo == CPU
+        con_cpu, primera = np.unique(pid_idx[es_cpu], return_index=True)
+        orden_cpu = con_cpu[np.argsort(primera)]
+        color_de[orden_cpu] = color_palette(np.arange(len(orden_cpu)))
+
+        self._capas = {}
+        self._colecciones = {}
+        capas = (
+            ("CPU", es_cpu, None),
+            ("BLOCK", tipo == BLOCK, to_rgba(_ESTILO_BLOCK[0], _ESTILO_BLOCK[2])),
+            ("IDLE", tipo == IDLE, to_rgba(_ESTILO_IDLE[0], _ESTILO_IDLE[2])),
+        )
+        for nombre, mascara, color_fijo in capas:
+            if not mascara.any():
+                continue
+            idx = pid_idx[mascara]
+            color = color_de[idx] if color_fijo is None else np.tile(color_fijo, (len(idx), 1))
+            self._capas[nombre] = _Capa(inicio[mascara], fin[mascara], fila_de[idx], color, idx, nombres)
+            # (detalle, resumen); autolim=False: los límites se fijan abajo, no según
+            # lo dibujado en cada vista
+            self._colecciones[nombre] = (
+                ax.add_collection(PolyCollection([], edgecolors="black"), autolim=False),
+                ax.add_collection(PolyCollection([], edgecolors="none", linewidths=0), autolim=False),
+            )
+
+        # Ejes: un PID por fila mientras los nombres entren en el alto del eje
+        medio = ALTO_BARRA / 2
+        alto_fila = ax.get_window_extent().height / (len(procesos) + 1)
+        if procesos and alto_fila >= TAM_FUENTE_ETIQUETA * ax.figure.dpi / 72:
+            ax.set_yticks(list(self.y_positions.values()))
+            ax.set_yticklabels(list(self.y_positions.keys()))
+        else:
+            ax.set_yticks([])
+        ax.set_ylim(-1 - medio - 0.2 if "IDLE" in self._capas else -medio - 0.2,
+                    max(len(procesos) - 1, 0) + medio + 0.2)
+
+        # Ticks enteros según el ancho visible (1, 2, 5, 10, ... unidades entre ticks)
+        ax.xaxis.set_major_locator(MaxNLocator(nbins="auto", integer=True, steps=[1, 2, 5, 10]))
+        if len(gantt):
+            ax.set_xlim(0, fin.max())
+
+        ax.set_xlabel("Tiempo")
+        ax.set_ylabel("Procesos")
+        ax.set_title(titulo)
+        ax.grid(True, axis='x', linestyle='--', alpha=0.6)
+
+        if leyenda:
+            legend_elements = [
+                plt.Rectangle((0,0),1,1, facecolor='lightblue', edgecolor='black', label='CPU'),
+                plt.Rectangle((0,0),1,1, facecolor='darkred', edgecolor='black', hatch='///', label='Bloqueo (E/S)'),
+                plt.Rectangle((0,0),1,1, facecolor='lightgray', edgecolor='black', alpha=0.7, label='IDLE')
+            ]
+            ax.legend(handles=legend_elements, loc='upper left', bbox_to_anchor=(1.02, 1))
 
-        # Si es IDLE, lo ponemos en una fila especial o en la fila del proceso anterior
-        y = y_positions.get(pid, -1)  # -1 si es IDLE
+        self.actualizar()
+        ax.callbacks.connect("xlim_changed", lambda _ax: self.actualizar())
 
-        ax.barh(y, end - start, left=start, height=0.5,
-                align='center', color=colors[pid], edgecolor='black')
+    def conectar(self, canvas):
+        """
+        Rearma la vista cuando cambia el tamaño del lienzo (cambia el ancho de un píxel)
+        y muestra el tooltip de los tramos al pasar el mouse.
+        """
+        canvas.mpl_connect("resize_event", lambda _evento: self.actualizar())
+        canvas.mpl_connect("draw_event", self._al_dibujar)
+        canvas.mpl_connect("motion_notify_event", self._al_mover)
 
-        # Etiqueta centrada
-        ax.text((start + end) / 2, y, pid,
-                ha='center', va='center', color='black', fontsize=9)
+    # ---------- Vista ----------
+    def actualizar(self):
+        """Rearma colecciones y etiquetas para los límites X actuales."""
+        self._fondo_animados = None  # el fondo guardado ya no corresponde a la vista
+        x0, x1 = sorted(self.ax.get_xlim())
+        ancho = self.ax.bbox.width
+        px_por_unidad = ancho / (x1 - x0) if x1 > x0 and ancho > 0 else 0.0
 
-    # Configuración del eje Y
-    ax.set_yticks(list(y_positions.values()))
-    ax.set_yticklabels(list(y_positions.keys()))
+        candidatas = []
+        for tipo, capa in self._capas.items():
+            idx = capa.visibles(x0, x1)
+            inicio, fin, fila, color = capa.inicio[idx], capa.fin[idx], capa.fila[idx], capa.color[idx]
 
-    # Configuración del eje X: mostrar todos los ticks
-    max_time = max(end for _, _, end in gantt_chart)
-    ax.set_xticks(range(0, max_time + 1))
-    ax.set_xlim(0, max_time)
+            # detalle: con borde (y rayado); resumen: angostos y agregados
+            pixeles = (fin - inicio) * px_por_unidad
+            detalle = pixeles >= MIN_PIXELES_DETALLE if px_por_unidad > 0 else np.ones(len(idx), dtype=bool)
+            resumen = [a[~detalle] for a in (inicio, fin, fila, color)]
+            if px_por_unidad > 0:
+                chicos = pixeles[~detalle] < MIN_PIXELES_TRAMO
+                if chicos.any():
+                    agregados = _agregar_chicos(resumen[0][chicos], resumen[2][chicos],
+                                                resumen[3][chicos], px_por_unidad)
+                    resumen = [np.concatenate((a[~chicos], b)) for a, b in zip(resumen, agregados)]
 
-    # Cuadrícula
-    ax.grid(True, axis='x', linestyle='--', alpha=0.6)
+            coleccion_detalle, coleccion_resumen = self._colecciones[tipo]
+            _asignar_barras(coleccion_detalle, inicio[detalle], fin[detalle], fila[detalle], color[detalle])
+            _asignar_barras(coleccion_resumen, *resumen)
+            if tipo == "BLOCK":
+                coleccion_detalle.set_hatch(_ESTILO_BLOCK[1] if detalle.sum() <= MAX_RAYADOS else None)
 
-    # Etiquetas y título
-    ax.set_xlabel("Tiempo")
-    ax.set_ylabel("Procesos")
-    ax.set_title(title)
+            # Sólo los tramos de detalle que no son IDLE llevan etiqueta
+            if self.etiquetas and tipo != "IDLE":
+                candidatas.append((tipo, capa, idx[detalle]))
 
-    # Leyenda
+        self._etiquetar(candidatas, x0, x1, px_por_unidad)
+
+    def _etiquetar(self, candidatas, x0, x1, px_por_unidad):
+        """Escribe el PID (y el tipo, en bloqueos) sólo en los tramos con lugar para el texto."""
+        for t in self._textos:
+            t.remove()
+        self._textos = []
+        if px_por_unidad <= 0:
+            return
+
+        # Ancho aproximado de un carácter (fuente de 7 pt)
+        px_por_caracter = TAM_FUENTE_ETIQUETA * 0.6 * self.ax.figure.dpi / 72
+        for tipo, capa, idx in candidatas:
+            # Descarte rápido de los que no entran ni con una etiqueta de dos caracteres
+            idx = idx[(capa.fin[idx] - capa.inicio[idx]) * px_por_unidad >= 2 * px_por_caracter]
+            for i in idx.tolist():
+                pid = capa.nombres[capa.pid_idx[i]]
+                start, end = capa.inicio[i], capa.fin[i]
+                texto = f"{pid}\n({tipo})" if tipo == "BLOCK" else str(pid)
+                caracteres = max(len(linea) for linea in texto.split("\n"))
+                if (end - start) * px_por_unidad < caracteres * px_por_caracter:
+                    continue
+                # Centrada en la parte visible del tramo: con zoom, el centro del tramo
+                # completo puede quedar a millones de píxeles y FreeType no lo dibuja
+                centro = (max(start, x0) + min(end, x1)) / 2
+                self._textos.append(self.ax.text(
+                    centro, capa.fila[i], texto, ha='center', va='center',
+                    fontsize=TAM_FUENTE_ETIQUETA,
+                    color="white" if tipo == "BLOCK" else "black",
+                    weight="bold" if tipo == "BLOCK" else "normal",
+                    animated=self._arrastrando,
+                ))
+                if len(self._textos) >= MAX_ETIQUETAS:
+                    return
+
+    # ---------- Capa animada: línea de tiempo y tooltip ----------
+    def marcar_tiempo(self, t):
+        """Ubica la línea de tiempo en t; sólo se redibuja la línea (blitting)."""
+        if self._cursor is None:
+            self._cursor = self.ax.axvline(t, color="red", linewidth=1.5, animated=True)
+        self._cursor.set_xdata([t, t])
+        if not self._arrastrando:  # durante el arrastre la dibuja arrastrar()
+            self._redibujar_animados()
+
+    def quitar_marca(self):
+        """Saca la línea de tiempo."""
+        if self._cursor is not None:
+            self._cursor.remove()
+            self._cursor = None
+            self._redibujar_animados()
+
+    def _animados(self):
+        return [a for a in (self._cursor, self._tooltip) if a is not None and a.get_visible()]
+
+    def _redibujar_animados(self):
+        """Dibuja línea y tooltip sobre el último dibujo completo, sin redibujar los tramos."""
+        canvas = self.ax.figure.canvas
+        if not getattr(canvas, "supports_blit", False):
+            canvas.draw_idle()
+        elif self._fondo_animados is None:
+            canvas.draw()  # _al_dibujar guarda el fondo y dibuja la capa animada
+        else:
+            canvas.restore_region(self._fondo_animados)
+            for artista in self._animados():
+                self.ax.draw_artist(artista)
+            canvas.blit(self.ax.figure.bbox)
+
+    def _al_dibujar(self, _evento):
+        # Después de un dibujo completo (zoom, cambio de tamaño, fin de arrastre) el
+        # fondo de la capa animada es ese dibujo; durante el arrastre no tiene tramos
+        canvas = self.ax.figure.canvas
+        if self._arrastrando or not getattr(canvas, "supports_blit", False):
+            self._fondo_animados = None
+            return
+        # Toda la figura: el tooltip puede salir del eje
+        self._fondo_animados = canvas.copy_from_bbox(self.ax.figure.bbox)
+        for artista in self._animados():
+            self.ax.draw_artist(artista)
+
+    def _al_mover(self, evento):
+        """Tooltip con el tramo bajo el mouse (búsqueda en el índice de intervalos del Gantt)."""
+        if self._arrastrando:
+            return
+        tramo = None
+        if evento.inaxes is self.ax and evento.xdata is not None:
+            fila = round(evento.ydata)
+            pid = self._pid_de_fila.get(fila)
+            if pid is not None and abs(evento.ydata - fila) <= ALTO_BARRA / 2:
+                tramo = self.gantt.indice_tramos().tramo_de(pid, evento.xdata)
+        if tramo == self._tramo_tooltip:
+            return
+        self._tramo_tooltip = tramo
+        if tramo is None:
+            if self._tooltip is not None and self._tooltip.get_visible():
+                self._tooltip.set_visible(False)
+                self._redibujar_animados()
+            return
+
+        pid, inicio, fin, tipo = tramo
+        if self._tooltip is None:
+            self._tooltip = self.ax.annotate(
+                "", xy=(0, 0), xytext=(12, 12), textcoords="offset points", fontsize=8,
+                bbox=dict(boxstyle="round", facecolor="lightyellow", alpha=0.95),
+                animated=True, annotation_clip=False,
+            )
+        # Del lado izquierdo del puntero en la mitad derecha del eje
+        a_la_izquierda = evento.x > self.ax.bbox.x0 + self.ax.bbox.width / 2
+        self._tooltip.xy = (evento.xdata, evento.ydata)
+        self._tooltip.set_position((-12 if a_la_izquierda else 12, 12))
+        self._tooltip.set_horizontalalignment("right" if a_la_izquierda else "left")
+        self._tooltip.set_text(f"{pid} - {_NOMBRES_TIPO[tipo]}\n{inicio} → {fin} (duración {fin - inicio})")
+        self._tooltip.set_visible(True)
+        self._redibujar_animados()
+
+    # ---------- Arrastre con blitting ----------
+    def _dinamicos(self):
+        return [c for par in self._colecciones.values() for c in par] + self._textos
+
+    def iniciar_arrastre(self):
+        """Guarda el fondo del eje sin los tramos; durante el arrastre sólo se redibujan ellos."""
+        canvas = self.ax.figure.canvas
+        if not getattr(canvas, "supports_blit", False):
+            return
+        self._arrastrando = True
+        if self._tooltip is not None:
+            self._tooltip.set_visible(False)
+            self._tramo_tooltip = None
+        for artista in self._dinamicos():
+            artista.set_animated(True)
+        # La grilla y los ticks quedan en el fondo fijo: la grilla se oculta hasta soltar
+        self.ax.grid(False)
+        canvas.draw()
+        self._fondo = canvas.copy_from_bbox(self.ax.bbox)
+
+    def arrastrar(self):
+        """Redibuja sólo los tramos sobre el fondo guardado (o todo, si no hay blitting)."""
+        canvas = self.ax.figure.canvas
+        if self._fondo is None:
+            canvas.draw_idle()
+            return
+        canvas.restore_region(self._fondo)
+        for artista in self._dinamicos():
+            self.ax.draw_artist(artista)
+        if self._cursor is not None:
+            self.ax.draw_artist(self._cursor)
+        canvas.blit(self.ax.bbox)
+
+    def terminar_arrastre(self):
+        """Vuelve al dibujo completo (ticks y grilla en la posición final)."""
+        if self._arrastrando:
+            self._arrastrando = False
+            self._fondo = None
+            for artista in self._dinamicos():
+                artista.set_animated(False)
+            self.ax.grid(True, axis='x', linestyle='--', alpha=0.6)
+        self.ax.figure.canvas.draw_idle()
+
+
+def _asignar_barras(coleccion, inicio, fin, fila, color):
+    """Reemplaza las barras de 'coleccion' por los rectángulos [inicio, fin] x fila ± medio alto."""
+    medio = ALTO_BARRA / 2
+    vertices = np.empty((len(inicio), 4, 2))
+    vertices[:, 0, 0] = vertices[:, 1, 0] = inicio
+    vertices[:, 2, 0] = vertices[:, 3, 0] = fin
+    vertices[:, 0, 1] = vertices[:, 3, 1] = fila - medio
+    vertices[:, 1, 1] = vertices[:, 2, 1] = fila + medio
+    coleccion.set_verts(vertices)
+    coleccion.set_facecolor(color)
+
+
+def _agregar_chicos(inicio, fila, color, px_por_unidad):
+    """
+    Junta tramos de menos de un píxel: una barra por racha de columnas de píxeles
+    ocupadas y contiguas en la misma fila.
+
+    :return: (inicios, fines, filas, colores) de las barras agregadas
+    """
+    columna = np.floor(inicio * px_por_unidad).astype(np.int64)
+    # Ordenadas por fila y columna, sin repetidas
+    claves, primero = np.unique(np.stack((fila.astype(np.int64), columna)),
+                                axis=1, return_index=True)
+    filas, columnas = claves
+    nueva_racha = np.ones(len(columnas), dtype=bool)
+    nueva_racha[1:] = (filas[1:] != filas[:-1]) | (columnas[1:] != columnas[:-1] + 1)
+    comienzos = np.flatnonzero(nueva_racha)
+    finales = np.append(comienzos[1:], len(columnas)) - 1
+    return (columnas[comienzos] / px_por_unidad,
+            (columnas[finales] + 1) / px_por_unidad,
+            filas[comienzos].astype(float),
+            color[primero[comienzos]])
+
+
+def plot_gantt(gantt_chart, title="Diagrama de Gantt"):
+    """
+    Genera un diagrama de Gantt con cada proceso en su propia fila.
+
+    :param gantt_chart: lista de tuplas (pid, start, end)
+                        Ej: [("P1", 0, 5), ("P2", 5, 8), ("IDLE", 8, 10)]
+    :param title: título del gráfico
+    """
+    num_procesos = len({seg[0] for seg in gantt_chart if seg[0] != "IDLE"})
+    fig, ax = plt.subplots(figsize=(10, min(max(num_procesos, 1) * 0.8, MAX_ALTO_FIGURA)))
+
+    dibujar_gantt(ax, gantt_chart, title, leyenda=False)
+
+    # Leyenda: un color por proceso
+    colors = {}
+    color_palette = plt.get_cmap("tab20", num_procesos + 1)
+    for seg in gantt_chart:
+        pid = seg[0]
+        if pid not in colors:
+            colors[pid] = "lightgray" if pid == "IDLE" else color_palette(
+                sum(1 for p in colors if p != "IDLE"))
     legend_patches = [mpatches.Patch(color=col, label=pid) for pid, col in colors.items()]
     ax.legend(handles=legend_patches, bbox_to_anchor=(1.05, 1), loc='upper left')
 
@@ -1,12 +1,33 @@
 # utils/historial.py
 import json
 import os
+import sqlite3
+from contextlib import closing
 from datetime import datetime
 from .paths import data_path  # usa storage persistente (AppData o modo portable)
 
-# Un único archivo para TODO el historial de inputs
+# Base SQLite con TODO el historial de inputs: una fila por configuración, con los
+# metadatos (nombre, fecha, cantidad de procesos) en columnas propias para listar sin
+# leer las listas de procesos, que van en la última columna (JSON).
+INPUT_HIST_DB = data_path("input_historial.sqlite3")
+
+# Archivo del formato anterior (un único JSON); se migra una sola vez a la base
 INPUT_HIST_FILE = data_path("input_historial.json")
 
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS configs (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    nombre       TEXT NOT NULL,
+    fecha        TEXT NOT NULL,
+    num_procesos INTEGER NOT NULL,
+    procesos     TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    clave TEXT PRIMARY KEY,
+    valor TEXT
+);
+"""
+
 
 # ------------ utilidades de IO ------------
 def _safe_load_json(path):
@@ -18,78 +39,86 @@ def _safe_load_json(path):
     except (json.JSONDecodeError, OSError):
         return []
 
-def _safe_save_json(path, data):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    tmp = path + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
-    try:
-        os.replace(tmp, path)
-    except Exception:
-        # Fallback si os.replace no está disponible
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
-        try:
-            os.remove(tmp)
-        except Exception:
-            pass
+def _conectar():
+    """Abre la base, crea las tablas si faltan y migra el JSON anterior (una vez)."""
+    os.makedirs(os.path.dirname(INPUT_HIST_DB), exist_ok=True)
+    con = sqlite3.connect(INPUT_HIST_DB)
+    with con:
+        con.executescript(_ESQUEMA)
+        if con.execute("SELECT 1 FROM meta WHERE clave = 'migrado_json'").fetchone() is None:
+            _migrar_json(con)
+    return con
 
+def _migrar_json(con):
+    """Copia las configuraciones de input_historial.json (si existe) en el mismo orden."""
+    data = _safe_load_json(INPUT_HIST_FILE)
+    if isinstance(data, list):
+        con.executemany(
+            "INSERT INTO configs (nombre, fecha, num_procesos, procesos) VALUES (?, ?, ?, ?)",
+            [_fila(it.get("nombre", f"Config {i+1}"), it.get("fecha", ""), it.get("procesos", []))
+             for i, it in enumerate(data) if isinstance(it, dict)],
+        )
+    # El JSON queda como respaldo; no se vuelve a leer
+    con.execute("INSERT INTO meta (clave, valor) VALUES ('migrado_json', ?)",
+                (datetime.now().isoformat(timespec="seconds"),))
 
-# ===== HISTORIAL DE CONFIGURACIONES DE INPUT =====
-def _leer_input_historial():
-    return _safe_load_json(INPUT_HIST_FILE)
+def _fila(nombre, fecha, procesos):
+    return (nombre, fecha, len(procesos),
+            json.dumps(procesos, ensure_ascii=False, separators=(",", ":")))
 
-def _guardar_input_historial(data):
-    _safe_save_json(INPUT_HIST_FILE, data)
 
+# ===== HISTORIAL DE CONFIGURACIONES DE INPUT =====
 def guardar_input_config(nombre, procesos_config):
     """
     Guarda una configuración de inputs.
     procesos_config: lista de dicts con:
       {"nombre": str, "arrival": int, "priority": int (opcional), "bursts": [int, ...]}
     """
-    data = _leer_input_historial()
     entrada = {
         "nombre": nombre,
         "fecha": datetime.now().isoformat(timespec="seconds"),
         "procesos": procesos_config
     }
-    data.append(entrada)
-    _guardar_input_historial(data)
+    with closing(_conectar()) as con, con:
+        con.execute(
+            "INSERT INTO configs (nombre, fecha, num_procesos, procesos) VALUES (?, ?, ?, ?)",
+            _fila(entrada["nombre"], entrada["fecha"], procesos_config),
+        )
     return entrada
 
 def listar_input_configs():
     """
-    Devuelve lista de (indice, nombre, fecha, num_procesos) para mostrar en la GUI.
+    Devuelve lista de (id, nombre, fecha, num_procesos) para mostrar en la GUI,
+    en orden de guardado. El id es el que reciben cargar/eliminar_input_config.
     """
-    data = _leer_input_historial()
-    return [
-        (i, it.get("nombre", f"Config {i+1}"),
-         it.get("fecha", ""),
-         len(it.get("procesos", [])))
-        for i, it in enumerate(data)
-    ]
+    with closing(_conectar()) as con:
+        return con.execute(
+            "SELECT id, nombre, fecha, num_procesos FROM configs ORDER BY id"
+        ).fetchall()
 
-def cargar_input_config(indice):
+def cargar_input_config(config_id):
     """
-    Devuelve la configuración de inputs guardada en la posición 'indice'.
+    Devuelve la configuración de inputs guardada con id 'config_id'.
     """
-    data = _leer_input_historial()
-    if 0 <= indice < len(data):
-        return data[indice]
-    return None
+    with closing(_conectar()) as con:
+        fila = con.execute(
+            "SELECT nombre, fecha, procesos FROM configs WHERE id = ?", (config_id,)
+        ).fetchone()
+    if fila is None:
+        return None
+    nombre, fecha, procesos = fila
+    return {"nombre": nombre, "fecha": fecha, "procesos": json.loads(procesos)}
 
-def eliminar_input_config(indice):
+def eliminar_input_config(config_id):
     """
     Elimina una configuración de inputs del historial y devuelve su nombre.
     """
-    data = _leer_input_historial()
-    if 0 <= indice < len(data):
-        nombre = data[indice].get("nombre")
-        del data[indice]
-        _guardar_input_historial(data)
-        return nombre
-    return None
+    with closing(_conectar()) as con, con:
+        fila = con.execute("SELECT nombre FROM configs WHERE id = ?", (config_id,)).fetchone()
+        if fila is None:
+            return None
+        con.execute("DELETE FROM configs WHERE id = ?", (config_id,))
+        return fila[0]
 # DEBUG/ayuda: devolver la ruta donde realmente se guarda
 def input_historial_path():
-    return INPUT_HIST_FILE
+    return INPUT_HIST_DB
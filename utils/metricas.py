@@ -1,36 +1,122 @@
+import random
+
+from models.gantt import Gantt, CPU, BLOCK
+
+try:
+    import numpy as np
+except ImportError:  # sin NumPy: calcular_metricas usa listas
+    np = None
+
+# Cuantiles informados por las métricas extendidas
+CUANTILES = (0.5, 0.95, 0.99)
+# Valores por nivel del boceto de cuantiles: hasta esta cantidad los cuantiles son exactos
+CAPACIDAD_BOCETO = 4096
+
+
 def calcular_metricas(procesos):
-    lista_metricas = []
-    total_tr = 0
-    total_te = 0
+    """
+    Métricas por proceso y promedios de una corrida.
 
-    for p in procesos:
-        # Asegurarnos de que las métricas estén calculadas
-        if p.turnaround_time is None or p.waiting_time is None:
-            p.calculate_metrics()
+    Junta en columnas llegada, finalización y totales de CPU/E-S de cada proceso y
+    calcula TR, TE y sus medias con metricas_vectorizadas(); los dicts por proceso
+    los arma la TablaMetricas recién cuando alguien la recorre (tabla de la GUI, CSV).
+
+    :return: (TablaMetricas, trm, tem)
+    """
+    finalizacion = [p.completion_time for p in procesos]
+    if None in finalizacion:
+        # Mismo error que antes: el proceso sin finalización no tiene métricas
+        procesos[finalizacion.index(None)].calculate_metrics()
+    llegada = [p.arrival_time for p in procesos]
+    cpu = [p.cpu_total for p in procesos]
+    tr, te, trm, tem = metricas_vectorizadas(
+        llegada, finalizacion, cpu, [p.es_total for p in procesos])
+    tabla = TablaMetricas([p.pid for p in procesos], llegada, cpu, finalizacion, tr, te)
+    return tabla, trm, tem
+
+
+def metricas_vectorizadas(llegada, finalizacion, cpu, es):
+    """
+    TR y TE de todos los procesos en una pasada sobre arreglos.
+
+        TR = finalización - llegada        TE = TR - CPU total - E/S total
+
+    :return: (tr, te, trm, tem); tr y te como arreglos NumPy (listas sin NumPy)
+    """
+    n = len(finalizacion)
+    if np is None:
+        tr = [f - l for f, l in zip(finalizacion, llegada)]
+        te = [r - c - e for r, c, e in zip(tr, cpu, es)]
+        return tr, te, (sum(tr) / n if n else 0), (sum(te) / n if n else 0)
+    tr = np.asarray(finalizacion) - np.asarray(llegada)
+    te = tr - np.asarray(cpu) - np.asarray(es)
+    # Suma exacta (enteros) y luego la división, como el promedio escalar
+    return tr, te, (tr.sum().item() / n if n else 0), (te.sum().item() / n if n else 0)
+
+
+class TablaMetricas:
+    """
+    Métricas por proceso guardadas en columnas.
+
+    Se recorre e indexa como la lista de dicts de siempre ({"PID", "Llegada", "CPU",
+    "Finalización", "TR", "TE"}), pero cada dict se arma al pedirlo; quien sólo
+    necesita una columna (el máximo de Finalización, por ejemplo) usa columna().
+    """
+    CLAVES = ("PID", "Llegada", "CPU", "Finalización", "TR", "TE")
+
+    __slots__ = ("_columnas",)
+
+    def __init__(self, pids, llegada, cpu, finalizacion, tr, te):
+        self._columnas = (pids, llegada, cpu, finalizacion, tr, te)
 
-        # Usar bursts_original si existe, si no, usar bursts actual
-        bursts_fuente = getattr(p, "bursts_original", p.bursts)
+    @classmethod
+    def desde_filas(cls, filas):
+        """Tabla a partir de dicts por proceso (entradas viejas de la caché)."""
+        filas = list(filas)
+        return cls(*([f[clave] for f in filas] for clave in cls.CLAVES))
 
-        # Suma de todas las ráfagas de CPU (índices pares)
-        total_cpu = sum(bursts_fuente[i] for i in range(0, len(bursts_fuente), 2))
+    @classmethod
+    def desde_columnas(cls, columnas):
+        """Inversa de a_columnas()."""
+        return cls(*(list(columnas[clave]) for clave in cls.CLAVES))
 
-        lista_metricas.append({
-            "PID": p.pid,
-            "Llegada": p.arrival_time,
-            "CPU": total_cpu,
-            "Finalización": p.completion_time,
-            "TR": p.turnaround_time,
-            "TE": p.waiting_time
-        })
+    def a_columnas(self):
+        """Dict clave -> lista de valores (serializable a JSON)."""
+        return {clave: _lista(col) for clave, col in zip(self.CLAVES, self._columnas)}
 
-        total_tr += p.turnaround_time
-        total_te += p.waiting_time
+    def columna(self, clave):
+        """Columna completa (arreglo NumPy o lista) sin armar filas."""
+        return self._columnas[self.CLAVES.index(clave)]
 
-    trm = total_tr / len(procesos) if procesos else 0
-    tem = total_te / len(procesos) if procesos else 0
+    def __len__(self):
+        return len(self._columnas[0])
 
-    return lista_metricas, trm, tem
+    def __iter__(self):
+        claves = self.CLAVES
+        for valores in zip(*(_lista(col) for col in self._columnas)):
+            yield dict(zip(claves, valores))
 
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return list(self)[i]
+        return {clave: _escalar(col[i]) for clave, col in zip(self.CLAVES, self._columnas)}
+
+    def __eq__(self, otra):
+        if isinstance(otra, (TablaMetricas, list, tuple)):
+            return list(self) == list(otra)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"TablaMetricas({len(self)} procesos)"
+
+
+def _lista(columna):
+    """Columna como lista de escalares de Python (ints siguen siendo ints)."""
+    return columna.tolist() if hasattr(columna, "tolist") else list(columna)
+
+
+def _escalar(valor):
+    return valor.item() if hasattr(valor, "item") else valor
 
 
 def imprimir_tabla_metricas(metricas, trm, tem):
@@ -43,3 +129,206 @@ def imprimir_tabla_metricas(metricas, trm, tem):
     print("\n📈 Promedios:")
     print(f"TRM (Tiempo de Respuesta Medio): {trm:.2f}")
     print(f"TEM (Tiempo de Espera Medio): {tem:.2f}")
+
+
+def contar_cambios_contexto(gantt):
+    """
+    Cuenta los cambios de contexto de un diagrama de Gantt: cuántas veces la CPU pasa
+    a ejecutar un proceso distinto del último que ejecutó. Los períodos IDLE y los
+    bloqueos no cuentan como proceso (P1 -> IDLE -> P2 es un cambio, P1 -> IDLE -> P1
+    ninguno) y el primer despacho tampoco es un cambio.
+    Acepta un Gantt o tuplas (pid, start, end) / (pid, start, end, tipo).
+    """
+    if isinstance(gantt, Gantt):
+        # Sobre las columnas, comparando índices de pid (sin armar tuplas)
+        pids = gantt.pids
+        ejecutados = (p for p, t in zip(gantt.pid_idx, gantt.tipo) if t == CPU and pids[p] != "IDLE")
+    else:
+        ejecutados = (tramo[0] for tramo in gantt
+                      if tramo[0] != "IDLE" and (len(tramo) != 4 or tramo[3] == "CPU"))
+    cambios = 0
+    anterior = None
+    for pid in ejecutados:
+        if anterior is not None and pid != anterior:
+            cambios += 1
+        anterior = pid
+    return cambios
+
+
+class BocetoCuantiles:
+    """
+    Cuantiles aproximados con memoria acotada (boceto de compactadores, estilo KLL).
+
+    Los valores entran al nivel 0; cuando un nivel junta 'capacidad' valores se ordena
+    y la mitad (los de posición par o impar, al azar) sube al nivel siguiente con el
+    doble de peso. Con n valores se guardan a lo sumo capacidad x log2(n / capacidad)
+    y el error de rango es de una pequeña fracción de n; con menos de 'capacidad'
+    valores el resultado es exacto. La semilla es fija: mismos datos, mismo resultado.
+    """
+
+    def __init__(self, capacidad=CAPACIDAD_BOCETO):
+        self.capacidad = capacidad
+        self.niveles = [[]]
+        self.n = 0
+        self._azar = random.Random(0)
+
+    def agregar(self, valor):
+        self.n += 1
+        nivel = self.niveles[0]
+        nivel.append(valor)
+        if len(nivel) >= self.capacidad:
+            self._compactar(0)
+
+    def _compactar(self, h):
+        nivel = self.niveles[h]
+        nivel.sort()
+        if h + 1 == len(self.niveles):
+            self.niveles.append([])
+        self.niveles[h + 1].extend(nivel[self._azar.randint(0, 1)::2])
+        nivel.clear()
+        if len(self.niveles[h + 1]) >= self.capacidad:
+            self._compactar(h + 1)
+
+    def cuantiles(self, qs):
+        """Valores en los cuantiles 'qs' (rango más cercano: el menor v con F(v) >= q); None si está vacío."""
+        if not self.n:
+            return [None] * len(qs)
+        pesados = sorted((v, 1 << h) for h, nivel in enumerate(self.niveles) for v in nivel)
+        total = sum(peso for _, peso in pesados)
+        resultado = []
+        for q in qs:
+            objetivo = max(1, -(-q * total // 1))  # ceil(q * total)
+            acumulado = 0
+            for valor, peso in pesados:
+                acumulado += peso
+                if acumulado >= objetivo:
+                    break
+            resultado.append(valor)
+        return resultado
+
+
+class MetricasCorrida:
+    """
+    Métricas extendidas de una corrida, en una sola pasada y con memoria acotada.
+
+    Se alimenta con agregar_proceso() (procesos terminados) y agregar_tramo() (tramos
+    del Gantt en orden); resultado() devuelve:
+
+    - procesos, duracion: cantidad de procesos y lapso desde la primera llegada hasta
+      la última finalización
+    - TRM, TEM, TPRM: medias de TR (finalización - llegada), TE (espera en listos) y
+      TPR (tiempo hasta la primera respuesta: primer despacho - llegada)
+    - TR_p50 / TR_p95 / TR_p99, y lo mismo para TE y TPR (ver BocetoCuantiles)
+    - throughput: procesos terminados por unidad de tiempo
+    - utilizacion_cpu: fracción de la duración con un proceso en CPU
+    - utilizacion_es: fracción de la duración con al menos un proceso bloqueado
+    - cambios_contexto: mismo criterio que contar_cambios_contexto
+
+    Los bloqueos deben llegar en orden de inicio (como los agrega el motor al Gantt)
+    para medir la E/S como unión de intervalos.
+    """
+
+    def __init__(self, capacidad=CAPACIDAD_BOCETO):
+        self.procesos = 0
+        self.suma = {"TR": 0, "TE": 0, "TPR": 0}
+        self.bocetos = {clave: BocetoCuantiles(capacidad) for clave in self.suma}
+        self.primera_llegada = None
+        self.ultima_finalizacion = None
+        self.tiempo_cpu = 0
+        self.tiempo_es = 0
+        self.cambios_contexto = 0
+        self._ultimo_pid = None
+        self._es_desde = None      # tramo de E/S (unión de bloqueos) en curso
+        self._es_hasta = None
+
+    def agregar_proceso(self, p):
+        """Suma un proceso terminado (con métricas calculadas)."""
+        if p.turnaround_time is None or p.waiting_time is None:
+            p.calculate_metrics()
+        valores = {"TR": p.turnaround_time, "TE": p.waiting_time,
+                   "TPR": (p.start_time if p.start_time is not None else p.completion_time) - p.arrival_time}
+        for clave, valor in valores.items():
+            self.suma[clave] += valor
+            self.bocetos[clave].agregar(valor)
+        self.procesos += 1
+        if self.primera_llegada is None or p.arrival_time < self.primera_llegada:
+            self.primera_llegada = p.arrival_time
+        if self.ultima_finalizacion is None or p.completion_time > self.ultima_finalizacion:
+            self.ultima_finalizacion = p.completion_time
+
+    def agregar_tramo(self, pid, inicio, fin, tipo="CPU"):
+        """Suma un tramo del Gantt (tipo "CPU", "BLOCK" o "IDLE")."""
+        if tipo == "BLOCK":
+            if self._es_hasta is not None and inicio <= self._es_hasta:
+                if fin > self._es_hasta:
+                    self._es_hasta = fin
+            else:
+                self._cerrar_es()
+                self._es_desde, self._es_hasta = inicio, fin
+        elif tipo == "CPU" and pid != "IDLE":
+            self.tiempo_cpu += fin - inicio
+            if self._ultimo_pid is not None and pid != self._ultimo_pid:
+                self.cambios_contexto += 1
+            self._ultimo_pid = pid
+
+    def _cerrar_es(self):
+        if self._es_hasta is not None:
+            self.tiempo_es += self._es_hasta - self._es_desde
+            self._es_desde = self._es_hasta = None
+
+    def resultado(self):
+        self._cerrar_es()
+        n = self.procesos
+        duracion = (self.ultima_finalizacion - self.primera_llegada) if n else 0
+        resultado = {
+            "procesos": n,
+            "duracion": duracion,
+            "TRM": self.suma["TR"] / n if n else 0,
+            "TEM": self.suma["TE"] / n if n else 0,
+            "TPRM": self.suma["TPR"] / n if n else 0,
+            "throughput": n / duracion if duracion else 0,
+            "utilizacion_cpu": self.tiempo_cpu / duracion if duracion else 0,
+            "utilizacion_es": self.tiempo_es / duracion if duracion else 0,
+            "cambios_contexto": self.cambios_contexto,
+        }
+        for clave, boceto in self.bocetos.items():
+            for q, valor in zip(CUANTILES, boceto.cuantiles(CUANTILES)):
+                resultado[f"{clave}_p{round(q * 100)}"] = valor
+        return resultado
+
+
+def metricas_extendidas(gantt, procesos, capacidad=CAPACIDAD_BOCETO):
+    """
+    MetricasCorrida.resultado() de una corrida: una pasada por los procesos y otra por
+    el Gantt (un Gantt se recorre sobre sus columnas, sin armar tuplas).
+    Acepta un Gantt o tuplas (pid, start, end) / (pid, start, end, tipo).
+    """
+    metricas = MetricasCorrida(capacidad)
+    for p in procesos:
+        metricas.agregar_proceso(p)
+    if isinstance(gantt, Gantt):
+        pids = gantt.pids
+        for p, inicio, fin, tipo in zip(gantt.pid_idx, gantt.inicio, gantt.fin, gantt.tipo):
+            if tipo == CPU:
+                metricas.agregar_tramo(pids[p], inicio, fin, "CPU")
+            elif tipo == BLOCK:
+                metricas.agregar_tramo(pids[p], inicio, fin, "BLOCK")
+    else:
+        for tramo in gantt:
+            if len(tramo) == 4:
+                metricas.agregar_tramo(*tramo)
+            elif len(tramo) == 3:
+                metricas.agregar_tramo(*tramo, "IDLE" if tramo[0] == "IDLE" else "CPU")
+    return metricas.resultado()
+
+
+def imprimir_metricas_extendidas(extendidas):
+    """Imprime en consola las métricas de metricas_extendidas()."""
+    e = extendidas
+    print("📊 Métricas extendidas:")
+    print(f"Throughput: {e['throughput']:.4f} procesos/unidad    "
+          f"CPU: {e['utilizacion_cpu']:.1%}    E/S: {e['utilizacion_es']:.1%}    "
+          f"Cambios de contexto: {e['cambios_contexto']}")
+    print(f"TPRM (Tiempo hasta la Primera Respuesta Medio): {e['TPRM']:.2f}")
+    for clave in ("TR", "TE", "TPR"):
+        print(f"{clave}  p50={e[clave + '_p50']}  p95={e[clave + '_p95']}  p99={e[clave + '_p99']}")
@@ -17,3 +17,26 @@ def parse_bursts(input_str):
             # CPU
             bursts.append(int(part))
     return bursts
+
+
+def config_a_procesos_data(config):
+    """
+    Convierte una configuración del historial de inputs en procesos_data.
+
+    config: {"nombre", "fecha", "procesos": [{"nombre", "arrival", "priority", "bursts"}, ...]}
+    Retorna: [{"pid", "arrival_time", "priority", "bursts"}, ...]
+    Si la secuencia de ráfagas tiene largo impar se cierra con 0 (pares = CPU, impares = BLOQ).
+    """
+    procesos_data = []
+    for item in config.get("procesos", []):
+        bursts = list(item.get("bursts", []))
+        if len(bursts) % 2 == 1:
+            bursts.append(0)
+
+        procesos_data.append({
+            "pid": item.get("nombre", "P?"),   # usamos el nombre guardado -> no hay mismatch
+            "arrival_time": int(item.get("arrival", 0)),
+            "priority": int(item.get("priority", 0)),
+            "bursts": bursts
+        })
+    return procesos_data